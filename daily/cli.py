@@ -1,19 +1,20 @@
 """daily CLI - Command line interface."""
 
-import os
-import subprocess
+import functools
+import re
 import sys
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-
-from daily.core import (
-    format_daily_file_for_display,
-    generate_cheat_data,
-    insert_bullet,
-    list_daily_files,
-)
+
+# typing costs a few ms to import and is only needed for annotations;
+# type checkers treat TYPE_CHECKING as true
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import NoReturn
+
+# Inline tags at the end of a bullet ("#tags: tag1,tag2"). Bullets are
+# single stripped lines, so only spaces/tabs can follow the marker and the
+# tag list runs to the end of the string.
+_TAGS_RE = re.compile(r"#tags:[ \t]*([^\n]+)\Z")
 
 
 def _fix_windows_console_encoding() -> None:
@@ -36,13 +37,13 @@ def _fix_windows_console_encoding() -> None:
 # Fix encoding issues on Windows before creating Console
 _fix_windows_console_encoding()
 
-console = Console()
 
-app = typer.Typer(
-    name="daily",
-    help="CLI for daily work logging.",
-    no_args_is_help=True,
-)
+@functools.cache
+def _console():
+    """Get the shared rich Console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 def parse_tags(tags: str | None) -> list[str] | None:
@@ -69,117 +70,44 @@ def validate_text(text: str) -> str:
         Validated text (stripped).
 
     Raises:
-        typer.BadParameter: If text is empty.
+        ValueError: If text is empty.
     """
     text = text.strip()
     if not text:
-        raise typer.BadParameter("Text cannot be empty")
+        raise ValueError("Text cannot be empty")
     return text
 
 
-@app.command()
-def did(
-    text: str = typer.Argument(..., help="Completed work description"),
-    tags: str = typer.Option(None, "--tags", "-t", help="Comma-separated tags"),
-) -> None:
-    """Log completed work (Yesterday section)."""
-    text = validate_text(text)
-    tag_list = parse_tags(tags)
-
-    insert_bullet("did", text, tags=tag_list)
-
-    if tag_list:
-        typer.echo(f"✓ Added to Done: {text} #tags: {','.join(tag_list)}")
-    else:
-        typer.echo(f"✓ Added to Done: {text}")
-
-
-@app.command()
-def plan(
-    text: str = typer.Argument(..., help="Planned work description"),
-    tags: str = typer.Option(None, "--tags", "-t", help="Comma-separated tags"),
-) -> None:
-    """Plan work (Today section)."""
-    text = validate_text(text)
-    tag_list = parse_tags(tags)
-
-    insert_bullet("plan", text, tags=tag_list)
-
-    if tag_list:
-        typer.echo(f"✓ Added to To Do: {text} #tags: {','.join(tag_list)}")
-    else:
-        typer.echo(f"✓ Added to To Do: {text}")
-
-
-@app.command()
-def block(
-    text: str = typer.Argument(..., help="Blocker description"),
-    tags: str = typer.Option(None, "--tags", "-t", help="Comma-separated tags"),
-) -> None:
-    """Log blocker (Blockers section)."""
-    text = validate_text(text)
-    tag_list = parse_tags(tags)
+def _fail(message: str) -> "NoReturn":
+    """Print a usage error to stderr and exit with status 2."""
+    sys.stderr.write(f"Error: {message}\nTry 'daily --help' for help.\n")
+    sys.exit(2)
 
-    insert_bullet("block", text, tags=tag_list)
-
-    if tag_list:
-        typer.echo(f"✓ Added to Blockers: {text} #tags: {','.join(tag_list)}")
-    else:
-        typer.echo(f"✓ Added to Blockers: {text}")
-
-
-@app.command()
-def meeting(
-    text: str = typer.Argument(..., help="Meeting description"),
-    tags: str = typer.Option(None, "--tags", "-t", help="Comma-separated tags"),
-) -> None:
-    """Log meeting (Meetings section)."""
-    text = validate_text(text)
-    tag_list = parse_tags(tags)
 
-    insert_bullet("meeting", text, tags=tag_list)
+def _add_bullet(section: str, label: str, text: str, tags: str | None) -> None:
+    """Validate input, insert the bullet and confirm it to the user."""
+    from daily.core import insert_bullet
 
-    if tag_list:
-        typer.echo(f"✓ Added to Meetings: {text} #tags: {','.join(tag_list)}")
-    else:
-        typer.echo(f"✓ Added to Meetings: {text}")
-
-
-@app.command()
-def quick(
-    text: str = typer.Argument(..., help="Quick note"),
-    tags: str = typer.Option(None, "--tags", "-t", help="Comma-separated tags"),
-) -> None:
-    """Add quick note (Quick Notes section)."""
-    text = validate_text(text)
+    try:
+        text = validate_text(text)
+    except ValueError as e:
+        _fail(f"Invalid value for 'TEXT': {e}")
     tag_list = parse_tags(tags)
 
-    insert_bullet("notes", text, tags=tag_list)
+    insert_bullet(section, text, tags=tag_list)
 
     if tag_list:
-        typer.echo(f"✓ Added to Quick Notes: {text} #tags: {','.join(tag_list)}")
+        print(f"✓ Added to {label}: {text} #tags: {','.join(tag_list)}")
     else:
-        typer.echo(f"✓ Added to Quick Notes: {text}")
+        print(f"✓ Added to {label}: {text}")
 
 
-@app.command()
-def cheat(
-    tags: str = typer.Option(None, "--tags", "-t", help="Filter by tags"),
-    plain: bool = typer.Option(
-        False, "--plain", "-p", help="Plain text output (no colors)"
-    ),
-    today: bool = typer.Option(
-        False, "--today", help="Show today's file instead of yesterday's"
-    ),
-    workdays: bool | None = typer.Option(
-        None,
-        "--workdays/--no-workdays",
-        help="Skip weekends when looking for yesterday's file (default: from config)",
-    ),
+def _run_cheat(
+    tags: str | None, plain: bool, today: bool, workdays: bool | None
 ) -> None:
-    """Show cheat sheet for daily standup (reads yesterday's entries by default)."""
+    """Show cheat sheet for daily standup."""
     from daily.config import get_skip_weekends
-    from daily.core import get_previous_workday
+    from daily.core import generate_cheat_data, get_previous_workday
 
     tag_list = parse_tags(tags)
 
@@ -200,6 +128,7 @@ def cheat(
         else:
             _print_cheat_rich(data, target_date)
     except FileNotFoundError:
+        console = _console()
         if today:
             console.print(
                 "[red]No entries for today.[/red] Use 'daily did' to get started."
@@ -208,14 +137,12 @@ def cheat(
             console.print(
                 "[red]No entries from yesterday.[/red] Use 'daily cheat --today' to see today's file."
             )
-        raise typer.Exit(1)
+        sys.exit(1)
 
 
 def _format_bullet_with_tags(bullet: str) -> str:
     """Format bullet with styled tags for rich output."""
-    import re
-
-    match = re.search(r"#tags:\s*(.+)$", bullet)
+    match = _TAGS_RE.search(bullet)
     if not match:
         return bullet
 
@@ -227,20 +154,29 @@ def _format_bullet_with_tags(bullet: str) -> str:
 
 def _print_cheat_plain(data: list[dict]) -> None:
     """Print cheat sheet in plain text."""
+    # Build the whole sheet first so it goes out in a single write
+    lines = []
     for section in data:
-        typer.echo(section["title"])
+        lines.append(section["title"])
         if section["bullets"]:
-            for bullet in section["bullets"]:
-                typer.echo(f"- {bullet}")
+            lines.extend(f"- {bullet}" for bullet in section["bullets"])
         else:
-            typer.echo("(no entries)")
-        typer.echo()
+            lines.append("(no entries)")
+        lines.append("")
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _print_cheat_rich(data: list[dict], date=None) -> None:
     """Print cheat sheet with rich formatting."""
     from datetime import datetime
 
+    from rich.console import Group
+    from rich.styled import Styled
+
+    console = _console()
+
     # Section styles
     styles = {
         "did": ("bold green", "✅"),
@@ -254,36 +190,95 @@ def _print_cheat_rich(data: list[dict], date=None) -> None:
     if date is None:
         date = datetime.now()
     date_str = date.strftime("%A, %B %d")
-    console.print(f"\n[dim]── {date_str} ──[/dim]")
+    # Renderables are built the way console.print would (markup and
+    # highlighting) and printed once as a Group
+    lines = [
+        console.render_str(""),
+        console.render_str(f"[dim]── {date_str} ──[/dim]"),
+    ]
 
     for section in data:
         style, icon = styles.get(section["key"], ("bold", "•"))
 
         # Section header
-        console.print(f"{icon} [bold]{section['title']}[/bold]", style=style)
+        header = f"{icon} [bold]{section['title']}[/bold]"
+        lines.append(Styled(console.render_str(header), style))
 
         if section["bullets"]:
             for bullet in section["bullets"]:
                 formatted = _format_bullet_with_tags(bullet)
-                console.print(f"   • {formatted}")
+                lines.append(console.render_str(f"   • {formatted}"))
         else:
-            console.print("   [dim](no entries)[/dim]")
+            lines.append(console.render_str("   [dim](no entries)[/dim]"))
 
-        console.print()
+        lines.append(console.render_str(""))
 
+    # Render the whole sheet in one print
+    console.print(Group(*lines))
 
-@app.command()
-def search(
-    tags: str = typer.Option(None, "--tags", "-t", help="Filter by tags"),
-) -> None:
+
+def _find_fzf() -> str | None:
+    """Locate the fzf binary: $PATH first, then the one bundled with iterfzf.
+
+    Returns:
+        Path to the fzf executable, or None if none is available.
+    """
+    import shutil
+
+    executable = shutil.which("fzf")
+    if executable is not None:
+        return executable
+
+    try:
+        from iterfzf import BUNDLED_EXECUTABLE
+    except ImportError:
+        return None
+
+    if BUNDLED_EXECUTABLE is not None and BUNDLED_EXECUTABLE.exists():
+        return str(BUNDLED_EXECUTABLE)
+    return None
+
+
+def _fzf_select(fzf: str, items: list[str], args: list[str]) -> str | None:
+    """Let the user pick one of items with fzf.
+
+    All items are sent to fzf in a single write; fzf draws its UI on the
+    terminal directly.
+
+    Args:
+        fzf: Path to the fzf executable.
+        items: Lines to choose from.
+        args: Extra fzf command line options.
+
+    Returns:
+        The selected line, or None if the user cancelled.
+    """
+    import subprocess
+
+    proc = subprocess.Popen([fzf, *args], stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    stdout, _ = proc.communicate("\n".join(items).encode("utf-8"))
+
+    # 1: no match, 130: interrupted (ESC / Ctrl-C)
+    if proc.returncode != 0:
+        return None
+    return stdout.decode("utf-8").rstrip("\r\n") or None
+
+
+def _run_search(tags: str | None) -> None:
     """Search and open daily files interactively with fzf."""
+    import os
+    import subprocess
+
+    from daily.core import format_daily_file_for_display, list_daily_files_with_tags
+
+    console = _console()
     tag_list = parse_tags(tags)
 
     try:
-        daily_files = list_daily_files(filter_tags=tag_list)
+        daily_files = list_daily_files_with_tags(filter_tags=tag_list)
     except Exception as e:
         console.print(f"[red]Error listing daily files: {e}[/red]")
-        raise typer.Exit(1)
+        sys.exit(1)
 
     if not daily_files:
         if tag_list:
@@ -292,75 +287,303 @@ def search(
             )
         else:
             console.print("[yellow]No daily files found.[/yellow]")
-        raise typer.Exit(0)
-
-    # Prepare items for fzf (display string -> file path mapping)
-    display_items = []
-    file_mapping = {}
-
-    for file_path, file_date in daily_files:
-        display = format_daily_file_for_display(file_path, file_date)
-        display_items.append(display)
-        file_mapping[display] = file_path
+        sys.exit(0)
+
+    # Prepare items for fzf: "index<TAB>file path<TAB>display". Only the
+    # display field is shown; the index maps the selection back to the file.
+    # Tags are only shown when the tag filter already read the files.
+    display_items = [
+        f"{i}\t{path}\t{format_daily_file_for_display(path, date, file_tags)}"
+        for i, (path, date, file_tags) in enumerate(daily_files)
+    ]
+
+    fzf = _find_fzf()
+    if fzf is None:
+        console.print("[red]daily search requires the 'fzf' binary.[/red]")
+        console.print("Install with: brew install fzf  (or apt-get install fzf)")
+        sys.exit(1)
 
     # Use fzf for interactive selection
     try:
-        from iterfzf import iterfzf
-
-        # fzf will replace {} with the selected item, but we need the file path
-        # We'll use a workaround: pass --preview option directly with file path extraction
-        # Since display format is "YYYY-MM-DD (...) - X entries", we extract the date
-        # and construct the file path
-
-        dailies_dir = str(daily_files[0][0].parent)  # Get dailies directory
-
-        # Preview command: extract date from line and cat the corresponding file
-        # Format: "2026-01-26 (Monday) - 3 entries" -> extract "2026-01-26"
-        preview_cmd = f"cat {dailies_dir}/{{1}}-daily.md 2>/dev/null || echo 'Preview not available'"
-
-        selected = iterfzf(
-            display_items,
-            multi=False,
-            preview=preview_cmd,
-            __extra__=["--preview-window=right:50%:wrap"],
-            prompt="Select daily file > ",
-            query="" if not tag_list else " ".join(tag_list),
-            ansi=True,
-        )
+        # Preview command: fzf replaces {2} with the (quoted) file path field
+        preview_cmd = "cat {2} 2>/dev/null || echo 'Preview not available'"
+
+        fzf_args = [
+            "--prompt=Select daily file > ",
+            "--no-sort",
+            "--delimiter=\t",
+            "--with-nth=3..",
+            f"--preview={preview_cmd}",
+            "--preview-window=right:50%:wrap",
+            "--ansi",
+        ]
+        if tag_list:
+            fzf_args.append(f"--query={' '.join(tag_list)}")
+
+        selected = _fzf_select(fzf, display_items, fzf_args)
 
         if not selected:
             # User cancelled (pressed ESC)
-            raise typer.Exit(0)
+            sys.exit(0)
 
-        # Get the file path from selection
-        selected_file = file_mapping[selected]
+        # Get the file path from the index field of the selection
+        selected_file = daily_files[int(selected.split("\t", 1)[0])][0]
 
         # Open in $EDITOR
         editor = os.environ.get("EDITOR", "vim")
 
         try:
-            subprocess.run([editor, str(selected_file)], check=True)
+            if sys.platform == "win32":
+                subprocess.run([editor, str(selected_file)], check=True)
+            else:
+                # Nothing is left to do after the editor exits, so replace this
+                # process with it instead of forking and waiting
+                sys.stdout.flush()
+                os.execvp(editor, [editor, str(selected_file)])
         except subprocess.CalledProcessError:
             console.print(f"[red]Failed to open {selected_file} with {editor}[/red]")
-            raise typer.Exit(1)
+            sys.exit(1)
         except FileNotFoundError:
             console.print(
                 f"[red]Editor '{editor}' not found. Set $EDITOR environment variable.[/red]"
             )
-            raise typer.Exit(1)
+            sys.exit(1)
 
-    except ImportError:
-        console.print(
-            "[red]fzf integration requires 'iterfzf' package and 'fzf' binary.[/red]"
-        )
-        console.print(
-            "Install with: pip install iterfzf && brew install fzf  (or apt-get install fzf)"
-        )
-        raise typer.Exit(1)
     except Exception as e:
         console.print(f"[red]Error during search: {e}[/red]")
-        raise typer.Exit(1)
+        sys.exit(1)
+
+
+# Flags accepted by `daily cheat`: flag -> (option name, value)
+_CHEAT_FLAGS = {
+    "--plain": ("plain", True),
+    "-p": ("plain", True),
+    "--today": ("today", True),
+    "--workdays": ("workdays", True),
+    "--no-workdays": ("workdays", False),
+}
+
+
+def _parse(
+    argv: list[str],
+    has_text: bool = False,
+    bools: dict[str, tuple[str, bool]] | None = None,
+) -> dict:
+    """Parse subcommand arguments in a single pass.
+
+    Supports `--tags/-t VALUE`, `--tags=VALUE`, `-tVALUE`, the given
+    boolean flags, bundled short options (`-pt VALUE`), an optional
+    positional TEXT argument and `--` to end option parsing.
+
+    Args:
+        argv: Arguments after the subcommand name.
+        has_text: Whether the command takes a positional TEXT argument.
+        bools: Mapping of boolean flag to (option name, value).
+
+    Returns:
+        Dictionary with the parsed options ("tags", "text" and bool names).
+    """
+    bools = bools or {}
+    opts: dict = {"tags": None}
+    positional: list[str] = []
+
+    args = iter(argv)
+    for arg in args:
+        if arg == "--":
+            positional.extend(args)
+        elif arg in ("--tags", "-t"):
+            value = next(args, None)
+            if value is None:
+                _fail(f"Option '{arg}' requires an argument.")
+            opts["tags"] = value
+        elif arg.startswith("--tags="):
+            opts["tags"] = arg[len("--tags=") :]
+        elif arg in bools:
+            name, flag_value = bools[arg]
+            opts[name] = flag_value
+        elif arg.startswith("-") and not arg.startswith("--") and len(arg) > 2:
+            # Bundled short options, as Click accepts them: -taws, -pt aws
+            for i, char in enumerate(arg[1:], start=2):
+                if char == "t":
+                    # The rest of the argument, or else the next one, is the value
+                    value = arg[i:] or next(args, None)
+                    if value is None:
+                        _fail("Option '-t' requires an argument.")
+                    opts["tags"] = value
+                    break
+                if f"-{char}" not in bools:
+                    _fail(f"No such option: -{char}")
+                name, flag_value = bools[f"-{char}"]
+                opts[name] = flag_value
+        elif arg.startswith("-") and arg != "-":
+            _fail(f"No such option: {arg}")
+        else:
+            positional.append(arg)
+
+    if has_text:
+        if not positional:
+            _fail("Missing argument 'TEXT'.")
+        opts["text"] = positional.pop(0)
+
+    if positional:
+        _fail(f"Got unexpected extra argument ({positional[0]})")
+
+    return opts
+
+
+# Bullet commands: (command, section key, label, TEXT help, command help)
+_BULLET_CMDS = (
+    (
+        "did",
+        "did",
+        "Done",
+        "Completed work description",
+        "Log completed work (Yesterday section).",
+    ),
+    (
+        "plan",
+        "plan",
+        "To Do",
+        "Planned work description",
+        "Plan work (Today section).",
+    ),
+    (
+        "block",
+        "block",
+        "Blockers",
+        "Blocker description",
+        "Log blocker (Blockers section).",
+    ),
+    (
+        "meeting",
+        "meeting",
+        "Meetings",
+        "Meeting description",
+        "Log meeting (Meetings section).",
+    ),
+    (
+        "quick",
+        "notes",
+        "Quick Notes",
+        "Quick note",
+        "Add quick note (Quick Notes section).",
+    ),
+)
+
+
+def _cmd_bullet(section: str, label: str, argv: list[str]) -> None:
+    """Handle `daily did/plan/block/meeting/quick`."""
+    opts = _parse(argv, has_text=True)
+    _add_bullet(section, label, opts["text"], opts["tags"])
+
+
+def _cmd_cheat(argv: list[str]) -> None:
+    """Handle `daily cheat`."""
+    opts = _parse(argv, bools=_CHEAT_FLAGS)
+    _run_cheat(
+        opts["tags"],
+        plain=opts.get("plain", False),
+        today=opts.get("today", False),
+        workdays=opts.get("workdays"),
+    )
+
+
+def _cmd_search(argv: list[str]) -> None:
+    """Handle `daily search`."""
+    opts = _parse(argv)
+    _run_search(opts["tags"])
+
+
+# Subcommand name -> handler taking the remaining argv
+_COMMANDS: dict[str, "Callable[[list[str]], None]"] = {
+    **{
+        name: functools.partial(_cmd_bullet, section, label)
+        for name, section, label, _, _ in _BULLET_CMDS
+    },
+    "cheat": _cmd_cheat,
+    "search": _cmd_search,
+}
+
+
+@functools.cache
+def _build_app():
+    """Build the Typer application.
+
+    Typer is only used to render `--help` (and usage errors for unknown
+    commands), so it is imported here instead of at module level.
+    """
+    import typer
+
+    app = typer.Typer(
+        name="daily",
+        help="CLI for daily work logging.",
+        no_args_is_help=True,
+    )
+
+    def make_bullet_command(section: str, label: str, text_help: str):
+        def command(
+            text: str = typer.Argument(..., help=text_help),
+            tags: str = typer.Option(None, "--tags", "-t", help="Comma-separated tags"),
+        ) -> None:
+            _add_bullet(section, label, text, tags)
+
+        return command
+
+    for name, section, label, text_help, help_text in _BULLET_CMDS:
+        app.command(name=name, help=help_text)(
+            make_bullet_command(section, label, text_help)
+        )
+
+    @app.command()
+    def cheat(
+        tags: str = typer.Option(None, "--tags", "-t", help="Filter by tags"),
+        plain: bool = typer.Option(
+            False, "--plain", "-p", help="Plain text output (no colors)"
+        ),
+        today: bool = typer.Option(
+            False, "--today", help="Show today's file instead of yesterday's"
+        ),
+        workdays: bool | None = typer.Option(
+            None,
+            "--workdays/--no-workdays",
+            help="Skip weekends when looking for yesterday's file (default: from config)",
+        ),
+    ) -> None:
+        """Show cheat sheet for daily standup (reads yesterday's entries by default)."""
+        _run_cheat(tags, plain, today, workdays)
+
+    @app.command()
+    def search(
+        tags: str = typer.Option(None, "--tags", "-t", help="Filter by tags"),
+    ) -> None:
+        """Search and open daily files interactively with fzf."""
+        _run_search(tags)
+
+    return app
+
+
+def __getattr__(name: str):
+    # `daily.cli.app` is built lazily so importing this module stays cheap
+    if name == "app":
+        return _build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Entry point: dispatch argv to a subcommand handler.
+
+    Help, missing or unknown commands are delegated to the Typer app.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    handler = _COMMANDS.get(argv[0]) if argv else None
+    if handler is None or "--help" in argv:
+        _build_app()(args=argv, prog_name="daily")
+        return
+
+    handler(argv[1:])
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -1,5 +1,6 @@
 """Configuration for daily."""
 
+import functools
 import os
 import tomllib
 from pathlib import Path
@@ -11,6 +12,10 @@ CONFIG_FILE = CONFIG_DIR / "config.toml"
 # Defaults
 DEFAULT_DAILIES_DIR = CONFIG_DIR / "dailies"
 
+# Cache of parsed daily files (safe to delete at any time)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "daily"
+INDEX_FILE = CACHE_DIR / "index.json"
+
 # Daily file name format
 DAILY_FILE_FORMAT = "%Y-%m-%d-daily.md"
 
@@ -50,6 +55,9 @@ def get_dailies_dir() -> Path:
     2. Config file ~/.daily/config.toml
     3. Default ~/.daily/dailies
 
+    The config file is only parsed again when it changes (see
+    _configured_dailies_dir).
+
     Returns:
         Path to dailies directory (created if it doesn't exist).
     """
@@ -58,19 +66,36 @@ def get_dailies_dir() -> Path:
     if env_dir:
         dailies_dir = Path(env_dir)
     else:
-        # 2. Config file
-        config = load_config_file()
-        config_dir = config.get("dailies_dir")
-        if config_dir:
-            dailies_dir = Path(config_dir).expanduser()
-        else:
-            # 3. Default
-            dailies_dir = DEFAULT_DAILIES_DIR
+        try:
+            config_mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+        except OSError:
+            config_mtime_ns = None
+        dailies_dir = _configured_dailies_dir(
+            CONFIG_FILE, config_mtime_ns, DEFAULT_DAILIES_DIR
+        )
 
     dailies_dir.mkdir(parents=True, exist_ok=True)
     return dailies_dir
 
 
+@functools.lru_cache(maxsize=1)
+def _configured_dailies_dir(
+    config_file: Path, config_mtime_ns: int | None, default_dir: Path
+) -> Path:
+    """Resolve the dailies directory from the config file or the default.
+
+    config_mtime_ns only keys the cache, so an edited config is read again.
+    """
+    # 2. Config file
+    config = load_config_file()
+    config_dir = config.get("dailies_dir")
+    if config_dir:
+        return Path(config_dir).expanduser()
+
+    # 3. Default
+    return default_dir
+
+
 def get_skip_weekends() -> bool:
     """Get skip_weekends setting.
 
@@ -1,16 +1,30 @@
 """Business logic for daily."""
 
+import functools
+import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from daily.config import DAILY_FILE_FORMAT, SECTIONS, get_dailies_dir
+from daily.config import DAILY_FILE_FORMAT, INDEX_FILE, SECTIONS, get_dailies_dir
 from daily.markdown import (
     create_daily_template,
+    extract_all_sections,
     extract_bullets_from_section,
     filter_bullets_by_tags,
+    find_bullet_insertion,
     format_bullet_with_tags,
     insert_at_section,
 )
+from daily.markdown import parse_tags as _parse_bullet_tags
+
+# Filename suffix shared by all daily files (see DAILY_FILE_FORMAT)
+_DAILY_FILE_SUFFIX = "-daily.md"
+
+# Headers of every section, in template order
+_ALL_SECTION_TITLES = tuple(SECTIONS.values())
+
+# Days back to the previous workday, indexed by weekday() (Monday=0, Sunday=6)
+_PREV_WORKDAY_OFFSET = (3, 1, 1, 1, 1, 1, 2)
 
 
 def get_previous_workday(
@@ -37,14 +51,10 @@ def get_previous_workday(
     if date is None:
         date = datetime.now()
 
-    previous = date - timedelta(days=1)
-
     if skip_weekends:
-        # weekday(): Monday=0, Sunday=6
-        while previous.weekday() >= 5:  # Saturday or Sunday
-            previous -= timedelta(days=1)
+        return date - timedelta(days=_PREV_WORKDAY_OFFSET[date.weekday()])
 
-    return previous
+    return date - timedelta(days=1)
 
 
 def get_daily_file_path(date: datetime | None = None) -> Path:
@@ -59,8 +69,33 @@ def get_daily_file_path(date: datetime | None = None) -> Path:
     if date is None:
         date = datetime.now()
 
-    filename = date.strftime(DAILY_FILE_FORMAT)
-    return get_dailies_dir() / filename
+    return _path_for_ymd(get_dailies_dir(), date.year, date.month, date.day)
+
+
+@functools.lru_cache(maxsize=32)
+def _path_for_ymd(dailies_dir: Path, year: int, month: int, day: int) -> Path:
+    """Build the daily file path for a calendar day (see get_daily_file_path)."""
+    filename = datetime(year, month, day).strftime(DAILY_FILE_FORMAT)
+    return dailies_dir / filename
+
+
+def _ensure_exists(file_path: Path, date: datetime) -> None:
+    """Create the daily file at file_path with the template if it's missing."""
+    if not file_path.exists():
+        template = create_daily_template(date)
+        file_path.write_text(template, encoding="utf-8")
+
+
+def _read(file_path: Path) -> str:
+    """Read the daily file at file_path.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist.
+    """
+    try:
+        return file_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No daily file exists for {file_path.name}") from None
 
 
 def ensure_daily_file_exists(date: datetime | None = None) -> Path:
@@ -79,11 +114,7 @@ def ensure_daily_file_exists(date: datetime | None = None) -> Path:
         date = datetime.now()
 
     file_path = get_daily_file_path(date)
-
-    if not file_path.exists():
-        template = create_daily_template(date)
-        file_path.write_text(template, encoding="utf-8")
-
+    _ensure_exists(file_path, date)
     return file_path
 
 
@@ -99,12 +130,7 @@ def read_daily_file(date: datetime | None = None) -> str:
     Raises:
         FileNotFoundError: If the file doesn't exist.
     """
-    file_path = get_daily_file_path(date)
-
-    if not file_path.exists():
-        raise FileNotFoundError(f"No daily file exists for {file_path.name}")
-
-    return file_path.read_text(encoding="utf-8")
+    return _read(get_daily_file_path(date))
 
 
 def write_daily_file(content: str, date: datetime | None = None) -> Path:
@@ -142,28 +168,42 @@ def insert_bullet(
     Raises:
         ValueError: If the section is not valid.
     """
-    if section not in SECTIONS:
+    section_title = SECTIONS.get(section)
+    if section_title is None:
         valid_sections = ", ".join(SECTIONS.keys())
         raise ValueError(f"Invalid section '{section}'. Use: {valid_sections}")
 
     if date is None:
         date = datetime.now()
 
-    # Ensure file exists
-    ensure_daily_file_exists(date)
-
-    # Read current content
-    content = read_daily_file(date)
+    # Resolve the path once and reuse it for every step below
+    file_path = get_daily_file_path(date)
 
     # Format bullet with tags
     bullet = format_bullet_with_tags(text, tags)
 
-    # Insert in section
-    section_title = SECTIONS[section]
-    new_content = insert_at_section(content, section_title, bullet)
+    try:
+        f = open(file_path, "r+b")
+    except FileNotFoundError:
+        # New file: write the template with the bullet already in place
+        content = insert_at_section(create_daily_template(date), section_title, bullet)
+        file_path.write_text(content, encoding="utf-8")
+        return file_path
+
+    with f:
+        # Decode without newline translation so offsets match the bytes on disk
+        data = f.read()
+        content = data.decode("utf-8")
+        newline = "\r\n" if "\r\n" in content else "\n"
+        offset, line = find_bullet_insertion(content, section_title, bullet, newline)
+
+        # Rewrite only from the insertion point; everything before is
+        # unchanged and the tail is written back from the bytes as read
+        byte_offset = len(content[:offset].encode("utf-8"))
+        f.seek(byte_offset)
+        f.write(line.encode("utf-8") + data[byte_offset:])
 
-    # Save
-    return write_daily_file(new_content, date)
+    return file_path
 
 
 def get_bullets_from_section(section: str, date: datetime | None = None) -> list[str]:
@@ -180,12 +220,12 @@ def get_bullets_from_section(section: str, date: datetime | None = None) -> list
         ValueError: If the section is not valid.
         FileNotFoundError: If the file doesn't exist.
     """
-    if section not in SECTIONS:
+    section_title = SECTIONS.get(section)
+    if section_title is None:
         valid_sections = ", ".join(SECTIONS.keys())
         raise ValueError(f"Invalid section '{section}'. Use: {valid_sections}")
 
     content = read_daily_file(date)
-    section_title = SECTIONS[section]
     return extract_bullets_from_section(content, section_title)
 
 
@@ -269,15 +309,17 @@ def generate_cheat_data(
         ("QUICK NOTES", "notes"),
     ]
 
+    # Parse every section, keeping only matching bullets, in one pass
+    section_bullets = extract_all_sections(
+        content,
+        [SECTIONS[section_key] for _, section_key in cheat_sections],
+        filter_tags,
+    )
+
     result = []
 
     for title, section_key in cheat_sections:
-        section_title = SECTIONS[section_key]
-        bullets = extract_bullets_from_section(content, section_title)
-
-        # Filter by tags if specified
-        if filter_tags:
-            bullets = filter_bullets_by_tags(bullets, filter_tags)
+        bullets = section_bullets[SECTIONS[section_key]]
 
         result.append(
             {
@@ -301,42 +343,177 @@ def list_daily_files(
     Returns:
         List of tuples (file_path, date) sorted by date descending (newest first).
     """
+    return [
+        (file_path, file_date)
+        for file_path, file_date, _ in list_daily_files_with_tags(filter_tags)
+    ]
+
+
+def list_daily_files_with_tags(
+    filter_tags: list[str] | None = None,
+) -> list[tuple[Path, datetime, set[str] | None]]:
+    """List all daily files with their tags, optionally filtered by tags.
+
+    Files are only read when filtering, so tags are only known then; the
+    tags collected by the filter pass are returned instead of discarded.
+    Tags are also kept in an index file keyed by each file's mtime and size,
+    so files that haven't changed since the last search aren't read again.
+
+    Args:
+        filter_tags: Optional list of tags to filter by.
+
+    Returns:
+        List of tuples (file_path, date, tags) sorted by date descending
+        (newest first). tags is the set of tags in the file, or None when
+        no filter was given.
+    """
     dailies_dir = get_dailies_dir()
 
-    # Find all daily markdown files
+    # Find all daily markdown files (a single directory scan, no globbing)
     daily_files = []
-    for file_path in dailies_dir.glob("*-daily.md"):
+    with os.scandir(dailies_dir) as it:
+        dir_entries = [e for e in it if e.name.endswith(_DAILY_FILE_SUFFIX)]
+
+    if filter_tags:
+        filter_set = {tag.lower() for tag in filter_tags}
+        # Tags of unchanged files come from the on-disk index; only new or
+        # modified files are read and parsed
+        index = _load_index()
+        cached = index.get(str(dailies_dir), {})
+        index_entries: dict[str, list] = {}
+
+    for dir_entry in dir_entries:
+        name = dir_entry.name
         try:
-            # Parse date from filename (YYYY-MM-DD-daily.md)
-            date_str = file_path.stem.replace("-daily", "")
-            file_date = datetime.strptime(date_str, "%Y-%m-%d")
+            file_date = _date_from_filename(name)
+            file_path = dailies_dir / name
 
             # If tags filter is specified, check if file contains any of the tags
+            tags = None
             if filter_tags:
-                content = file_path.read_text(encoding="utf-8")
+                st = dir_entry.stat()
+                entry = cached.get(name)
+                if entry is not None and entry[:2] == [st.st_mtime_ns, st.st_size]:
+                    tags = set(entry[2])
+                else:
+                    content = file_path.read_bytes().decode("utf-8")
+                    tags = _tags_in_content(content)
+                    entry = [st.st_mtime_ns, st.st_size, sorted(tags)]
+                index_entries[name] = entry
+
                 # Check if ANY bullet in the file has at least one of the tags
-                has_matching_bullet = False
-                for section_title in SECTIONS.values():
-                    bullets = extract_bullets_from_section(content, section_title)
-                    filtered = filter_bullets_by_tags(bullets, filter_tags)
-                    if filtered:
-                        has_matching_bullet = True
-                        break
-
-                if not has_matching_bullet:
+                if not any(tag.lower() in filter_set for tag in tags):
                     continue
 
-            daily_files.append((file_path, file_date))
+            daily_files.append((file_path, file_date, tags))
         except (ValueError, OSError):
             # Skip files that don't match expected format or can't be read
             continue
 
+    # Rebuilding the directory's entries also drops files that are gone
+    if filter_tags and index_entries != cached:
+        index[str(dailies_dir)] = index_entries
+        _save_index(index)
+
     # Sort by date descending (newest first)
     daily_files.sort(key=lambda x: x[1], reverse=True)
 
     return daily_files
 
 
+def _load_index() -> dict[str, dict[str, list]]:
+    """Load the tag index (see list_daily_files_with_tags).
+
+    The index maps a dailies directory to {file name: [mtime_ns, size,
+    tags]}. A missing or unreadable index is treated as empty, and entries
+    that don't have that shape are dropped (their files are read again).
+
+    Returns:
+        The index, or an empty dict.
+    """
+    # Only searching with tags uses the index; keep json off the other paths
+    import json
+
+    try:
+        with open(INDEX_FILE, encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict):
+        return {}
+
+    return {
+        dir_key: {
+            name: entry for name, entry in files.items() if _is_index_entry(entry)
+        }
+        for dir_key, files in index.items()
+        if isinstance(files, dict)
+    }
+
+
+def _is_index_entry(entry: object) -> bool:
+    """Check that a loaded index entry is [mtime_ns, size, [tag, ...]]."""
+    return (
+        isinstance(entry, list)
+        and len(entry) == 3
+        and isinstance(entry[0], int)
+        and isinstance(entry[1], int)
+        and isinstance(entry[2], list)
+        and all(isinstance(tag, str) for tag in entry[2])
+    )
+
+
+def _save_index(index: dict[str, dict[str, list]]) -> None:
+    """Write the tag index atomically; failures are ignored (it's a cache)."""
+    import json
+
+    tmp_file = INDEX_FILE.with_name(f"{INDEX_FILE.name}.{os.getpid()}.tmp")
+    try:
+        INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp_file, INDEX_FILE)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def _date_from_filename(name: str) -> datetime:
+    """Parse the date of a daily file name (YYYY-MM-DD-daily.md).
+
+    The name has a fixed shape, so it is sliced directly instead of going
+    through strptime.
+
+    Args:
+        name: File name ending with the daily suffix.
+
+    Returns:
+        Date of the daily file.
+
+    Raises:
+        ValueError: If the name isn't a valid daily file name.
+    """
+    digits = name[0:4] + name[5:7] + name[8:10]
+    if (
+        len(name) != 10 + len(_DAILY_FILE_SUFFIX)
+        or name[4] != "-"
+        or name[7] != "-"
+        or not (digits.isascii() and digits.isdigit())
+    ):
+        raise ValueError(f"Not a daily file name: {name}")
+    return datetime(int(name[0:4]), int(name[5:7]), int(name[8:10]))
+
+
+def _tags_in_content(content: str) -> set[str]:
+    """Collect the unique tags of the bullets in every section of content."""
+    all_tags = set()
+
+    for bullets in extract_all_sections(content, _ALL_SECTION_TITLES).values():
+        for bullet in bullets:
+            all_tags.update(_parse_bullet_tags(bullet))
+
+    return all_tags
+
+
 def get_all_tags_from_file(file_path: Path) -> set[str]:
     """Extract all unique tags from a daily file.
 
@@ -347,28 +524,23 @@ def get_all_tags_from_file(file_path: Path) -> set[str]:
         Set of unique tags found in the file.
     """
     try:
-        content = file_path.read_text(encoding="utf-8")
-        all_tags = set()
-
-        for section_title in SECTIONS.values():
-            bullets = extract_bullets_from_section(content, section_title)
-            for bullet in bullets:
-                from daily.markdown import parse_tags
-
-                tags = parse_tags(bullet)
-                all_tags.update(tags)
-
-        return all_tags
+        return _tags_in_content(file_path.read_text(encoding="utf-8"))
     except OSError:
         return set()
 
 
-def format_daily_file_for_display(file_path: Path, file_date: datetime) -> str:
+def format_daily_file_for_display(
+    file_path: Path, file_date: datetime, tags: set[str] | None = None
+) -> str:
     """Format a daily file for display in search results.
 
+    The file itself is not read; pass tags if they are already known (e.g.
+    from list_daily_files_with_tags) to include them.
+
     Args:
         file_path: Path to the daily file.
         file_date: Date of the daily file.
+        tags: Optional set of tags to show.
 
     Returns:
         Formatted string for display (e.g., "2026-01-26 (Monday) - tags: aws,cicd").
@@ -376,16 +548,10 @@ def format_daily_file_for_display(file_path: Path, file_date: datetime) -> str:
     # Get day of week
     day_name = file_date.strftime("%A")
 
-    # Get all tags
-    try:
-        tags = get_all_tags_from_file(file_path)
-
-        base_display = f"{file_date.strftime('%Y-%m-%d')} ({day_name})"
+    date_str = f"{file_date.year:04d}-{file_date.month:02d}-{file_date.day:02d}"
+    base_display = f"{date_str} ({day_name})"
 
-        if tags:
-            tags_display = ",".join(sorted(tags))
-            return f"{base_display} - tags: {tags_display}"
-        else:
-            return base_display
-    except OSError:
-        return f"{file_date.strftime('%Y-%m-%d')} ({day_name})"
+    if tags:
+        tags_display = ",".join(sorted(tags))
+        return f"{base_display} - tags: {tags_display}"
+    return base_display
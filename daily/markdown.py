@@ -1,10 +1,43 @@
 """Markdown file manipulation for daily."""
 
 import re
+from collections.abc import Iterable
 from datetime import datetime
 
 from daily.config import SECTIONS, TAG_FORMAT
 
+# Marker of the inline tags at the end of a bullet ("#tags: tag1,tag2")
+_TAGS_MARKER = "#tags:"
+
+# Known section headers; any of them ends the previous section
+_SECTION_TITLES = frozenset(SECTIONS.values())
+
+# Section lookups on the raw content work with character offsets; a header
+# is a line that equals the title once surrounding whitespace is stripped
+_LINE_PAD = r"[^\S\n]*"
+_SECTION_RE = re.compile(
+    rf"(?m)^{_LINE_PAD}(?:{'|'.join(map(re.escape, _SECTION_TITLES))}){_LINE_PAD}$"
+)
+
+# A bullet line: "- text" once stripped; the group is the text without the
+# "- " prefix and trailing whitespace
+_BULLET_RE = re.compile(rf"(?m)^{_LINE_PAD}- ([^\n]*\S){_LINE_PAD}$")
+
+
+def _compile_header_re(section_title: str) -> re.Pattern[str]:
+    """Compile a regex matching a header line for section_title."""
+    return re.compile(rf"(?m)^{_LINE_PAD}{re.escape(section_title)}{_LINE_PAD}$")
+
+
+# Header regexes of the known sections, built once at import
+_HEADER_RES = {title: _compile_header_re(title) for title in _SECTION_TITLES}
+
+
+# Daily template around the date: front matter, then every section (in
+# SECTIONS order) separated by a blank line
+_TEMPLATE_PREFIX = "---\ntype: daily\ndate: "
+_TEMPLATE_SUFFIX = "\n---\n\n" + "\n\n".join(SECTIONS.values()) + "\n"
+
 
 def create_daily_template(date: datetime) -> str:
     """Generate daily file template.
@@ -15,22 +48,9 @@ def create_daily_template(date: datetime) -> str:
     Returns:
         String with the complete Markdown template.
     """
-    date_str = date.strftime("%Y-%m-%d")
-    return f"""---
-type: daily
-date: {date_str}
----
-
-## ✅ Done
-
-## ▶️ To Do
-
-## 🚧 Blockers
-
-## 🗓 Meetings
-
-## 🧠 Quick Notes
-"""
+    # Formatted directly rather than with strftime (fixed format, no locale)
+    date_str = f"{date.year:04d}-{date.month:02d}-{date.day:02d}"
+    return f"{_TEMPLATE_PREFIX}{date_str}{_TEMPLATE_SUFFIX}"
 
 
 def find_section(content: str, section_title: str) -> int:
@@ -43,11 +63,11 @@ def find_section(content: str, section_title: str) -> int:
     Returns:
         Line index where the section is, or -1 if not found.
     """
-    lines = content.split("\n")
-    for i, line in enumerate(lines):
-        if line.strip() == section_title:
-            return i
-    return -1
+    header = _header_re(section_title).search(content)
+    if header is None:
+        return -1
+    # The match starts at the beginning of the header line
+    return content.count("\n", 0, header.start())
 
 
 def find_next_section(content: str, after_line: int) -> int:
@@ -60,54 +80,104 @@ def find_next_section(content: str, after_line: int) -> int:
     Returns:
         Index of the next section, or total lines if none found.
     """
-    lines = content.split("\n")
-    section_titles = set(SECTIONS.values())
+    # Offset of the line after after_line
+    start = 0
+    for _ in range(after_line + 1):
+        start = content.find("\n", start) + 1
+        if not start:
+            return content.count("\n") + 1
 
-    for i in range(after_line + 1, len(lines)):
-        if lines[i].strip() in section_titles:
-            return i
+    next_header = _SECTION_RE.search(content, start)
+    if next_header is None:
+        return content.count("\n") + 1
+    return content.count("\n", 0, next_header.start())
 
-    return len(lines)
 
+def _header_re(section_title: str) -> re.Pattern[str]:
+    """Regex matching a header line for section_title."""
+    header_re = _HEADER_RES.get(section_title)
+    if header_re is None:
+        # Not a known section; re caches recently compiled patterns
+        header_re = _compile_header_re(section_title)
+    return header_re
 
-def insert_at_section(content: str, section_title: str, bullet: str) -> str:
-    """Insert a bullet in a specific section.
 
-    The bullet is inserted at the end of the section, just before the next
-    section or at the end of the file.
+def _section_span(content: str, section_title: str) -> tuple[int, int] | None:
+    """Find a section in content.
+
+    Returns:
+        Tuple (end of the header line, start of the next section's line or
+        len(content)) as character offsets, or None if the section doesn't
+        exist.
+    """
+    header = _header_re(section_title).search(content)
+    if header is None:
+        return None
+
+    next_header = _SECTION_RE.search(content, header.end())
+    return header.end(), next_header.start() if next_header else len(content)
+
+
+def find_bullet_insertion(
+    content: str, section_title: str, bullet: str, newline: str = "\n"
+) -> tuple[int, str]:
+    """Find where and what to insert to add a bullet to a section.
+
+    The bullet goes at the end of the section, right after its last
+    non-empty line (or right after the header if the section is empty).
 
     Args:
         content: Markdown file content.
         section_title: Section title where to insert.
         bullet: Bullet text to insert (without the "- " prefix).
+        newline: Line ending to use for the inserted line.
 
     Returns:
-        New content with the bullet inserted.
+        Tuple (offset, text): inserting text at character offset of content
+        gives the new content.
 
     Raises:
         ValueError: If the section doesn't exist in the content.
     """
-    section_line = find_section(content, section_title)
-    if section_line == -1:
+    span = _section_span(content, section_title)
+    if span is None:
         raise ValueError(f"Section '{section_title}' not found")
 
-    lines = content.split("\n")
-    next_section = find_next_section(content, section_line)
-
-    # Find insertion position (last non-empty line of the section)
-    insert_pos = section_line + 1
+    header_end, section_end = span
 
-    # Find the last line with content before the next section
-    for i in range(next_section - 1, section_line, -1):
-        if lines[i].strip():
-            insert_pos = i + 1
-            break
+    # End of the last line with content before the next section (the header
+    # line itself if the section is empty)
+    body = content[header_end:section_end].rstrip()
+    line_end = content.find("\n", header_end + len(body))
 
-    # Insert the bullet
     bullet_line = f"- {bullet}"
-    lines.insert(insert_pos, bullet_line)
+    if line_end != -1:
+        # Insert a whole line at the start of the following line
+        return line_end + 1, bullet_line + newline
 
-    return "\n".join(lines)
+    # The section ends the file and there is no trailing newline
+    return len(content), newline + bullet_line
+
+
+def insert_at_section(content: str, section_title: str, bullet: str) -> str:
+    """Insert a bullet in a specific section.
+
+    The bullet is inserted at the end of the section, just before the next
+    section or at the end of the file.
+
+    Args:
+        content: Markdown file content.
+        section_title: Section title where to insert.
+        bullet: Bullet text to insert (without the "- " prefix).
+
+    Returns:
+        New content with the bullet inserted.
+
+    Raises:
+        ValueError: If the section doesn't exist in the content.
+    """
+    offset, text = find_bullet_insertion(content, section_title, bullet)
+    return content[:offset] + text + content[offset:]
 
 
 def parse_tags(bullet: str) -> list[str]:
@@ -121,11 +191,12 @@ def parse_tags(bullet: str) -> list[str]:
     Returns:
         List of tags found, or empty list if none.
     """
-    match = re.search(r"#tags:\s*(.+)$", bullet)
-    if not match:
+    # A plain substring search; everything after the marker is the tag list
+    i = bullet.find(_TAGS_MARKER)
+    if i == -1:
         return []
 
-    tags_str = match.group(1)
+    tags_str = bullet[i + len(_TAGS_MARKER) :]
     return [tag.strip() for tag in tags_str.split(",") if tag.strip()]
 
 
@@ -156,20 +227,58 @@ def extract_bullets_from_section(content: str, section_title: str) -> list[str]:
     Returns:
         List of bullets (without the "- " prefix).
     """
-    section_line = find_section(content, section_title)
-    if section_line == -1:
+    span = _section_span(content, section_title)
+    if span is None:
         return []
 
-    lines = content.split("\n")
-    next_section = find_next_section(content, section_line)
+    # Match the bullets in place instead of stripping every line
+    return _BULLET_RE.findall(content, *span)
 
-    bullets = []
-    for i in range(section_line + 1, next_section):
-        line = lines[i].strip()
-        if line.startswith("- "):
-            bullets.append(line[2:])  # Remove "- " prefix
 
-    return bullets
+def extract_all_sections(
+    content: str, section_titles: Iterable[str], tags: list[str] | None = None
+) -> dict[str, list[str]]:
+    """Extract the bullets of several sections in a single pass.
+
+    Equivalent to calling extract_bullets_from_section for each title
+    (followed by filter_bullets_by_tags if tags are given), but walks the
+    content only once.
+
+    Args:
+        content: Markdown file content.
+        section_titles: Section titles to extract.
+        tags: Optional list of tags; only bullets with at least one of them
+            are kept.
+
+    Returns:
+        Dict mapping each section title to its bullets (without the "- "
+        prefix). Sections not found map to an empty list.
+    """
+    tags_set = frozenset(tag.lower() for tag in tags) if tags else None
+    result: dict[str, list[str]] = {title: [] for title in section_titles}
+    started = set()
+    current = None
+
+    for line in content.split("\n"):
+        line = line.strip()
+        if line in result and line not in started:
+            # First occurrence of a requested section
+            started.add(line)
+            current = result[line]
+        elif line in _SECTION_TITLES:
+            current = None
+        elif current is not None and line.startswith("- "):
+            bullet = line[2:]  # Remove "- " prefix
+            if tags_set is None:
+                current.append(bullet)
+            elif _TAGS_MARKER in bullet and not tags_set.isdisjoint(
+                tag.lower() for tag in parse_tags(bullet)
+            ):
+                # Filtered while extracting; untagged bullets are skipped
+                # before their tags are parsed
+                current.append(bullet)
+
+    return result
 
 
 def filter_bullets_by_tags(bullets: list[str], tags: list[str]) -> list[str]:
@@ -185,12 +294,17 @@ def filter_bullets_by_tags(bullets: list[str], tags: list[str]) -> list[str]:
     if not tags:
         return bullets
 
-    filtered = []
-    tags_set = set(tag.lower() for tag in tags)
+    # Nothing can match if no bullet is tagged at all (common in logs that
+    # don't use tags); a substring check per bullet settles it
+    if not any(_TAGS_MARKER in bullet for bullet in bullets):
+        return []
 
-    for bullet in bullets:
-        bullet_tags = set(tag.lower() for tag in parse_tags(bullet))
-        if bullet_tags & tags_set:  # Non-empty intersection
-            filtered.append(bullet)
+    # The query tags are lowered once; each bullet's tags are checked
+    # against them without building a set per bullet
+    tags_set = frozenset(tag.lower() for tag in tags)
 
-    return filtered
+    return [
+        bullet
+        for bullet in bullets
+        if not tags_set.isdisjoint(tag.lower() for tag in parse_tags(bullet))
+    ]
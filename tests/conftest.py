@@ -0,0 +1,99 @@
+"""Shared test fixtures."""
+
+import re
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from daily.config import SECTIONS
+from daily.core import write_daily_file
+from daily.markdown import (
+    create_daily_template,
+    format_bullet_with_tags,
+    insert_at_section,
+)
+
+# Date most tests write their daily file for, and its template. The template
+# is built once here since create_daily_template is pure.
+DATE = datetime(2026, 1, 26)
+TEMPLATE = create_daily_template(DATE)
+
+
+def assert_order(content: str, *substrings: str) -> None:
+    """Assert that substrings first occur in content in the given order."""
+    positions = [content.index(substring) for substring in substrings]
+    assert positions == sorted(positions), positions
+
+
+def assert_contains_all(content: str, *substrings: str) -> None:
+    """Assert that every substring occurs in content, listing the missing ones."""
+    missing = [substring for substring in substrings if substring not in content]
+    assert not missing, missing
+
+
+def write_daily_with_bullets(
+    date: datetime, sections: dict[str, list[tuple[str, list[str] | None]]]
+) -> Path:
+    """Write a daily file holding the given bullets in a single write.
+
+    Builds the same content as successive insert_bullet calls, for tests
+    that only need a populated file rather than exercising insert_bullet.
+
+    Args:
+        date: Date of the daily file.
+        sections: Section name mapped to (text, tags) pairs, in insertion order.
+
+    Returns:
+        Path to the written file.
+    """
+    content = create_daily_template(date)
+    for section, bullets in sections.items():
+        for text, tags in bullets:
+            bullet = format_bullet_with_tags(text, tags)
+            content = insert_at_section(content, SECTIONS[section], bullet)
+    return write_daily_file(content, date)
+
+
+@pytest.fixture(scope="session")
+def tests_root(tmp_path_factory):
+    """One temporary directory shared by the whole test session."""
+    return tmp_path_factory.mktemp("daily")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_index_file(tests_root):
+    """Keep the tag index out of the real cache directory.
+
+    The index is keyed by dailies directory, and every test gets its own
+    dailies directory, so one index file can serve the whole session.
+    """
+    index_file = tests_root / "cache" / "index.json"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("daily.core.INDEX_FILE", index_file)
+        yield index_file
+
+
+@pytest.fixture
+def temp_dailies_dir(tests_root, request, monkeypatch):
+    """Fixture that configures a temporary directory for dailies.
+
+    Each test gets its own subdirectory of the session directory, named
+    after the test, instead of a fresh tmp_path.
+    """
+    dailies_dir = tests_root / "dailies" / re.sub(r"[^\w.-]+", "_", request.node.nodeid)
+    dailies_dir.mkdir(parents=True)
+    monkeypatch.setenv("DAILY_DIR", str(dailies_dir))
+    return dailies_dir
+
+
+@pytest.fixture
+def in_memory_daily(monkeypatch):
+    """Serve read_daily_file from a dict instead of the dailies directory.
+
+    For tests whose code only reads the daily file. Map a date to its
+    content in the returned dict; unknown dates raise KeyError.
+    """
+    store: dict[datetime, str] = {}
+    monkeypatch.setattr("daily.core.read_daily_file", lambda date: store[date])
+    return store
@@ -1,25 +1,18 @@
 """Tests for the CLI module."""
 
+import sys
 from datetime import datetime
 
 import pytest
 from typer.testing import CliRunner
 
-from daily.cli import app
+from daily.cli import app, main
 from daily.core import get_daily_file_path, read_daily_file
+from tests.conftest import assert_order
 
 runner = CliRunner()
 
 
-@pytest.fixture
-def temp_dailies_dir(tmp_path, monkeypatch):
-    """Fixture that configures a temporary directory for dailies."""
-    dailies_dir = tmp_path / "dailies"
-    dailies_dir.mkdir()
-    monkeypatch.setenv("DAILY_DIR", str(dailies_dir))
-    return dailies_dir
-
-
 class TestDidCommand:
     """Tests for the did command."""
 
@@ -42,12 +35,7 @@ class TestDidCommand:
         assert "- Deploy completed" in content
 
         # Verify it's in the correct section
-        lines = content.split("\n")
-        done_idx = next(i for i, l in enumerate(lines) if "## ✅ Done" in l)
-        todo_idx = next(i for i, l in enumerate(lines) if "## ▶️ To Do" in l)
-        bullet_idx = next(i for i, l in enumerate(lines) if "- Deploy completed" in l)
-
-        assert done_idx < bullet_idx < todo_idx
+        assert_order(content, "## ✅ Done", "- Deploy completed", "## ▶️ To Do")
 
     def test_did_command_with_tags(self, temp_dailies_dir):
         """Formats tags correctly."""
@@ -81,12 +69,7 @@ class TestPlanCommand:
         assert "- Review PR" in content
 
         # Verify it's in the correct section
-        lines = content.split("\n")
-        todo_idx = next(i for i, l in enumerate(lines) if "## ▶️ To Do" in l)
-        blockers_idx = next(i for i, l in enumerate(lines) if "## 🚧 Blockers" in l)
-        bullet_idx = next(i for i, l in enumerate(lines) if "- Review PR" in l)
-
-        assert todo_idx < bullet_idx < blockers_idx
+        assert_order(content, "## ▶️ To Do", "- Review PR", "## 🚧 Blockers")
 
     def test_plan_command_with_tags(self, temp_dailies_dir):
         """Formats tags correctly."""
@@ -111,15 +94,10 @@ class TestBlockCommand:
         assert "- Waiting for AWS permissions" in content
 
         # Verify it's in the correct section
-        lines = content.split("\n")
-        blockers_idx = next(i for i, l in enumerate(lines) if "## 🚧 Blockers" in l)
-        meetings_idx = next(i for i, l in enumerate(lines) if "## 🗓 Meetings" in l)
-        bullet_idx = next(
-            i for i, l in enumerate(lines) if "- Waiting for AWS permissions" in l
+        assert_order(
+            content, "## 🚧 Blockers", "- Waiting for AWS permissions", "## 🗓 Meetings"
         )
 
-        assert blockers_idx < bullet_idx < meetings_idx
-
     def test_block_command_with_tags(self, temp_dailies_dir):
         """Formats tags correctly."""
         result = runner.invoke(app, ["block", "VPN down", "--tags", "infra,urgent"])
@@ -143,12 +121,7 @@ class TestMeetingCommand:
         assert "- Daily standup" in content
 
         # Verify it's in the correct section
-        lines = content.split("\n")
-        meetings_idx = next(i for i, l in enumerate(lines) if "## 🗓 Meetings" in l)
-        notes_idx = next(i for i, l in enumerate(lines) if "## 🧠 Quick Notes" in l)
-        bullet_idx = next(i for i, l in enumerate(lines) if "- Daily standup" in l)
-
-        assert meetings_idx < bullet_idx < notes_idx
+        assert_order(content, "## 🗓 Meetings", "- Daily standup", "## 🧠 Quick Notes")
 
     def test_meeting_command_with_tags(self, temp_dailies_dir):
         """Formats tags correctly."""
@@ -236,23 +209,28 @@ class TestCommandHelp:
 class TestMultipleInsertions:
     """Tests for multiple insertions."""
 
+    @staticmethod
+    def _invoke_all(*commands: list[str]) -> None:
+        """Run each command in turn, checking that every one succeeds."""
+        for args in commands:
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0, result.output
+
     def test_multiple_bullets_same_section(self, temp_dailies_dir):
         """Inserts multiple bullets in the same section."""
-        runner.invoke(app, ["did", "Task 1"])
-        runner.invoke(app, ["did", "Task 2"])
-        runner.invoke(app, ["did", "Task 3"])
+        self._invoke_all(["did", "Task 1"], ["did", "Task 2"], ["did", "Task 3"])
 
         content = read_daily_file()
-        assert "- Task 1" in content
-        assert "- Task 2" in content
-        assert "- Task 3" in content
+        assert "- Task 1\n- Task 2\n- Task 3\n" in content
 
     def test_bullets_different_sections(self, temp_dailies_dir):
         """Inserts bullets in different sections."""
-        runner.invoke(app, ["did", "Done yesterday"])
-        runner.invoke(app, ["plan", "For today"])
-        runner.invoke(app, ["block", "A blocker"])
-        runner.invoke(app, ["meeting", "A meeting"])
+        self._invoke_all(
+            ["did", "Done yesterday"],
+            ["plan", "For today"],
+            ["block", "A blocker"],
+            ["meeting", "A meeting"],
+        )
 
         content = read_daily_file()
         assert "- Done yesterday" in content
@@ -346,6 +324,24 @@ class TestCheatCommand:
         assert result.exit_code == 1
         assert "No entries from yesterday" in result.output
 
+    def test_cheat_plain_single_write(self, monkeypatch, capsys):
+        """Plain output is written in a single call."""
+        from daily.cli import _print_cheat_plain
+
+        writes = []
+        real_write = sys.stdout.write
+        monkeypatch.setattr(
+            sys.stdout, "write", lambda s: writes.append(s) or real_write(s)
+        )
+
+        data = [
+            {"key": "did", "title": "DONE", "bullets": ["Task 1", "Task 2"]},
+            {"key": "plan", "title": "TO DO", "bullets": []},
+        ]
+        _print_cheat_plain(data)
+
+        assert writes == ["DONE\n- Task 1\n- Task 2\n\nTO DO\n(no entries)\n\n"]
+
     def test_cheat_help(self):
         """Shows help for cheat."""
         result = runner.invoke(app, ["cheat", "--help"])
@@ -475,3 +471,174 @@ class TestCheatWeekendLogic:
 
         assert result.exit_code == 0
         assert "Sunday work" in result.output
+
+
+class TestMainDispatcher:
+    """Tests for the argv dispatcher used by the `daily` entry point."""
+
+    def test_main_inserts_bullet(self, temp_dailies_dir, capsys):
+        """Dispatches bullet commands without going through Typer."""
+        main(["did", "Fast path task", "-t", "cicd,aws"])
+
+        output = capsys.readouterr().out
+        assert "Added to Done: Fast path task #tags: cicd,aws" in output
+        assert "- Fast path task #tags: cicd,aws" in read_daily_file()
+
+    def test_main_tags_equals_syntax(self, temp_dailies_dir):
+        """Accepts --tags=VALUE."""
+        main(["plan", "Setup CI", "--tags=infra"])
+
+        assert "- Setup CI #tags: infra" in read_daily_file()
+
+    def test_main_double_dash_ends_options(self, temp_dailies_dir):
+        """Text after -- is taken literally even if it looks like an option."""
+        main(["quick", "--", "-t is not a tag"])
+
+        assert "- -t is not a tag" in read_daily_file()
+
+    def test_main_attached_tag_value(self, temp_dailies_dir):
+        """Accepts -tVALUE, like Click does."""
+        main(["did", "-taws", "Deploy"])
+
+        assert "- Deploy #tags: aws" in read_daily_file()
+
+    def test_main_bundled_short_options(self, temp_dailies_dir, capsys):
+        """Accepts bundled short options, with -t taking the next argument."""
+        main(["did", "Deploy", "-t", "aws"])
+        main(["did", "Other"])
+        capsys.readouterr()
+
+        main(["cheat", "--today", "-pt", "aws"])
+
+        output = capsys.readouterr().out
+        assert "- Deploy #tags: aws" in output
+        assert "Other" not in output
+
+    def test_main_cheat_flags(self, temp_dailies_dir, capsys):
+        """Parses cheat boolean flags."""
+        main(["did", "Today task"])
+        capsys.readouterr()
+
+        main(["cheat", "--today", "--plain"])
+
+        output = capsys.readouterr().out
+        assert "DONE" in output
+        assert "- Today task" in output
+
+    @pytest.mark.parametrize(
+        "argv,message",
+        [
+            (["did"], "Missing argument 'TEXT'"),
+            (["did", "   "], "cannot be empty"),
+            (["did", "Task", "--bogus"], "No such option: --bogus"),
+            (["did", "Task", "extra"], "unexpected extra argument (extra)"),
+            (["did", "Task", "--tags"], "requires an argument"),
+            (["did", "Task", "-xt", "aws"], "No such option: -x"),
+            (["cheat", "-pt"], "Option '-t' requires an argument"),
+        ],
+    )
+    def test_main_usage_errors(self, temp_dailies_dir, capsys, argv, message):
+        """Usage errors go to stderr with exit code 2."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(argv)
+
+        assert exc_info.value.code == 2
+        assert message in capsys.readouterr().err
+
+    def test_import_does_not_load_typer_or_rich(self):
+        """Importing the CLI module doesn't import Typer or rich."""
+        import subprocess
+
+        code = (
+            "import sys, daily.cli; "
+            "print(any(m in sys.modules for m in ('typer', 'rich', 'daily.core')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"
+
+
+class TestSearchCommand:
+    """Tests for the search command."""
+
+    def test_search_replaces_process_with_editor(self, temp_dailies_dir, monkeypatch):
+        """Opens the selected file by exec'ing $EDITOR."""
+        from daily.core import insert_bullet
+
+        date = datetime(2026, 1, 27)
+        insert_bullet("did", "Entry", date=date)
+
+        calls = []
+        monkeypatch.setenv("EDITOR", "myeditor")
+        monkeypatch.setattr("sys.platform", "linux")
+        monkeypatch.setattr("daily.cli._find_fzf", lambda: "fzf")
+        monkeypatch.setattr("daily.cli._fzf_select", lambda fzf, items, args: items[0])
+        monkeypatch.setattr("os.execvp", lambda *args: calls.append(args))
+
+        main(["search"])
+
+        file_path = str(temp_dailies_dir / "2026-01-27-daily.md")
+        assert calls == [("myeditor", ["myeditor", file_path])]
+
+    def test_search_maps_selection_by_index(self, temp_dailies_dir, monkeypatch):
+        """Maps the selected line back to its file through the index field."""
+        from daily.core import insert_bullet
+
+        insert_bullet("did", "Newer", date=datetime(2026, 1, 27))
+        insert_bullet("did", "Older", date=datetime(2026, 1, 26))
+
+        calls = []
+        seen_args = []
+        monkeypatch.setattr("sys.platform", "linux")
+        monkeypatch.setattr("daily.cli._find_fzf", lambda: "fzf")
+
+        def fake_select(fzf, items, args):
+            seen_args.extend(args)
+            return items[1]
+
+        monkeypatch.setattr("daily.cli._fzf_select", fake_select)
+        monkeypatch.setattr("os.execvp", lambda *args: calls.append(args))
+
+        main(["search"])
+
+        assert "--with-nth=3.." in seen_args
+        assert calls[0][1][1] == str(temp_dailies_dir / "2026-01-26-daily.md")
+
+    def test_search_without_fzf(self, temp_dailies_dir, monkeypatch):
+        """Fails with an install hint when fzf is not available."""
+        from daily.core import insert_bullet
+
+        insert_bullet("did", "Entry", date=datetime(2026, 1, 27))
+        monkeypatch.setattr("daily.cli._find_fzf", lambda: None)
+
+        result = runner.invoke(app, ["search"])
+
+        assert result.exit_code == 1
+        assert "requires the 'fzf' binary" in result.output
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script")
+    def test_fzf_select_pipes_items(self, tmp_path):
+        """Sends all items to fzf and returns the selected line."""
+        from daily.cli import _fzf_select
+
+        fake_fzf = tmp_path / "fzf"
+        fake_fzf.write_text("#!/bin/sh\nsed -n 2p\n")
+        fake_fzf.chmod(0o755)
+
+        assert _fzf_select(str(fake_fzf), ["first", "second"], []) == "second"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script")
+    def test_fzf_select_cancelled(self, tmp_path):
+        """Returns None when fzf exits with a non-zero status."""
+        from daily.cli import _fzf_select
+
+        fake_fzf = tmp_path / "fzf"
+        fake_fzf.write_text("#!/bin/sh\ncat > /dev/null\nexit 130\n")
+        fake_fzf.chmod(0o755)
+
+        assert _fzf_select(str(fake_fzf), ["first"], []) is None
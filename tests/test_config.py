@@ -1,5 +1,6 @@
 """Tests for the config module."""
 
+import os
 from pathlib import Path
 
 from daily.config import (
@@ -155,6 +156,39 @@ class TestGetDailiesDir:
         result = get_dailies_dir()
         assert result == default_dir
 
+    def test_env_var_change_is_picked_up(self, tmp_path, monkeypatch):
+        """Follows changes to DAILY_DIR between calls."""
+        monkeypatch.setenv("DAILY_DIR", str(tmp_path / "first"))
+        assert get_dailies_dir() == tmp_path / "first"
+
+        monkeypatch.setenv("DAILY_DIR", str(tmp_path / "second"))
+        assert get_dailies_dir() == tmp_path / "second"
+
+    def test_deleted_directory_is_recreated(self, tmp_path, monkeypatch):
+        """Recreates the directory if it is removed between calls."""
+        env_dir = tmp_path / "dailies"
+        monkeypatch.setenv("DAILY_DIR", str(env_dir))
+        get_dailies_dir()
+
+        env_dir.rmdir()
+
+        assert get_dailies_dir().is_dir()
+
+    def test_config_edit_is_picked_up(self, tmp_path, monkeypatch):
+        """Rereads the config file after it changes."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text(f'dailies_dir = "{tmp_path / "first"}"')
+        monkeypatch.delenv("DAILY_DIR", raising=False)
+        monkeypatch.setattr("daily.config.CONFIG_FILE", config_file)
+        assert get_dailies_dir() == tmp_path / "first"
+
+        config_file.write_text(f'dailies_dir = "{tmp_path / "second"}"')
+        # Make sure the edit is seen even within one mtime tick
+        st = config_file.stat()
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+
+        assert get_dailies_dir() == tmp_path / "second"
+
     def test_config_expands_tilde(self, tmp_path, monkeypatch):
         """Expands ~ in config path."""
         config_file = tmp_path / "config.toml"
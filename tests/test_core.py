@@ -4,6 +4,7 @@ from datetime import datetime
 
 import pytest
 
+from daily.config import SECTIONS
 from daily.core import (
     ensure_daily_file_exists,
     generate_cheat,
@@ -15,74 +16,80 @@ from daily.core import (
     read_daily_file,
     write_daily_file,
 )
+from tests.conftest import (
+    DATE,
+    TEMPLATE,
+    assert_contains_all,
+    write_daily_with_bullets,
+)
+
+# "Now" for every test in this module (a Tuesday)
+FROZEN_NOW = datetime(2026, 2, 3)
+
 
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
 
-@pytest.fixture
-def temp_dailies_dir(tmp_path, monkeypatch):
-    """Fixture that configures a temporary directory for dailies."""
-    dailies_dir = tmp_path / "dailies"
-    dailies_dir.mkdir()
-    monkeypatch.setenv("DAILY_DIR", str(dailies_dir))
-    return dailies_dir
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+@pytest.fixture(autouse=True, scope="module")
+def frozen_now():
+    """Freeze datetime.now() in daily.core once for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("daily.core.datetime", _FrozenDatetime)
+        yield FROZEN_NOW
 
 
 class TestGetPreviousWorkday:
     """Tests for get_previous_workday."""
 
-    def test_monday_returns_friday(self):
-        """Monday returns previous Friday."""
-        monday = datetime(2026, 2, 2)  # Monday
-        result = get_previous_workday(monday)
-        assert result.weekday() == 4  # Friday
-        assert result.day == 30  # Jan 30
-
-    def test_tuesday_returns_monday(self):
-        """Tuesday returns Monday."""
-        tuesday = datetime(2026, 2, 3)
-        result = get_previous_workday(tuesday)
-        assert result.weekday() == 0  # Monday
-        assert result.day == 2
-
-    def test_wednesday_returns_tuesday(self):
-        """Wednesday returns Tuesday."""
-        wednesday = datetime(2026, 2, 4)
-        result = get_previous_workday(wednesday)
-        assert result.weekday() == 1  # Tuesday
-        assert result.day == 3
-
-    def test_sunday_returns_friday(self):
-        """Sunday returns Friday."""
-        sunday = datetime(2026, 2, 1)
-        result = get_previous_workday(sunday)
-        assert result.weekday() == 4  # Friday
-        assert result.day == 30
-
-    def test_saturday_returns_friday(self):
-        """Saturday returns Friday."""
-        saturday = datetime(2026, 1, 31)
-        result = get_previous_workday(saturday)
-        assert result.weekday() == 4  # Friday
-        assert result.day == 30
+    @pytest.mark.parametrize(
+        "date,skip_weekends,expected_weekday,expected_day",
+        [
+            pytest.param(datetime(2026, 2, 2), True, 4, 30, id="monday_returns_friday"),
+            pytest.param(datetime(2026, 2, 3), True, 0, 2, id="tuesday_returns_monday"),
+            pytest.param(
+                datetime(2026, 2, 4), True, 1, 3, id="wednesday_returns_tuesday"
+            ),
+            pytest.param(
+                datetime(2026, 2, 6), True, 3, 5, id="friday_returns_thursday"
+            ),
+            pytest.param(datetime(2026, 2, 1), True, 4, 30, id="sunday_returns_friday"),
+            pytest.param(
+                datetime(2026, 1, 31), True, 4, 30, id="saturday_returns_friday"
+            ),
+            pytest.param(
+                datetime(2026, 2, 2),
+                False,
+                6,
+                1,
+                id="skip_weekends_false_monday_returns_sunday",
+            ),
+            # Without skipping, Saturday gives the literal yesterday (Friday)
+            pytest.param(
+                datetime(2026, 1, 31),
+                False,
+                4,
+                30,
+                id="skip_weekends_false_always_returns_yesterday",
+            ),
+        ],
+    )
+    def test_previous_workday(
+        self, date, skip_weekends, expected_weekday, expected_day
+    ):
+        """Returns the expected previous day for each weekday."""
+        result = get_previous_workday(date, skip_weekends=skip_weekends)
+        assert result.weekday() == expected_weekday
+        assert result.day == expected_day
 
     def test_no_date_uses_today(self):
         """Uses current date when no date provided."""
         result = get_previous_workday()
-        # Should return a datetime before today
-        assert result < datetime.now()
-
-    def test_skip_weekends_false_monday_returns_sunday(self):
-        """When skip_weekends=False, Monday returns Sunday."""
-        monday = datetime(2026, 2, 2)  # Monday
-        result = get_previous_workday(monday, skip_weekends=False)
-        assert result.weekday() == 6  # Sunday
-        assert result.day == 1
-
-    def test_skip_weekends_false_always_returns_yesterday(self):
-        """When skip_weekends=False, always returns literal yesterday."""
-        saturday = datetime(2026, 1, 31)  # Saturday
-        result = get_previous_workday(saturday, skip_weekends=False)
-        assert result.weekday() == 4  # Friday (literal yesterday)
-        assert result.day == 30
+        assert result == datetime(2026, 2, 2)  # Monday before FROZEN_NOW
 
 
 class TestGetDailyFilePath:
@@ -99,9 +106,8 @@ class TestGetDailyFilePath:
     def test_get_daily_file_path_without_date(self, temp_dailies_dir):
         """Generates path for current date if not specified."""
         result = get_daily_file_path()
-        today = datetime.now().strftime("%Y-%m-%d")
 
-        assert result.name == f"{today}-daily.md"
+        assert result.name == "2026-02-03-daily.md"
 
     def test_get_daily_file_path_different_dates(self, temp_dailies_dir):
         """Generates different paths for different dates."""
@@ -174,6 +180,26 @@ class TestReadDailyFile:
         with pytest.raises(FileNotFoundError, match="No daily file exists"):
             read_daily_file(date)
 
+    def test_read_daily_file_sees_rewrite_with_same_size(self, temp_dailies_dir):
+        """A same-size rewrite right after a read isn't served from cache."""
+        date = datetime(2026, 1, 26)
+        write_daily_file("content A", date)
+        assert read_daily_file(date) == "content A"
+
+        write_daily_file("content B", date)
+
+        assert read_daily_file(date) == "content B"
+
+    def test_read_daily_file_sees_external_edit(self, temp_dailies_dir):
+        """A file changed outside daily is read again."""
+        date = datetime(2026, 1, 26)
+        file_path = ensure_daily_file_exists(date)
+        read_daily_file(date)
+
+        file_path.write_text("edited by hand", encoding="utf-8")
+
+        assert read_daily_file(date) == "edited by hand"
+
 
 class TestWriteDailyFile:
     """Tests for write_daily_file."""
@@ -191,7 +217,8 @@ class TestWriteDailyFile:
     def test_write_daily_file_overwrites(self, temp_dailies_dir):
         """Overwrites existing file."""
         date = datetime(2026, 1, 26)
-        ensure_daily_file_exists(date)
+        # Longer than the new content, so a missing truncate would show
+        write_daily_file("# Old content, longer", date)
 
         new_content = "# New content"
         result = write_daily_file(new_content, date)
@@ -228,20 +255,33 @@ class TestInsertBullet:
         content = read_daily_file(date)
         assert "- Deploy #tags: cicd,aws" in content
 
-    def test_insert_bullet_different_sections(self, temp_dailies_dir):
-        """Inserts in different sections correctly."""
+    @pytest.mark.parametrize("section", list(SECTIONS))
+    def test_insert_bullet_different_sections(self, temp_dailies_dir, section):
+        """Inserts in the requested section, leaving the others untouched."""
         date = datetime(2026, 1, 26)
+        # Every section already holds a bullet, written in one go
+        write_daily_with_bullets(
+            date, {name: [(f"Existing {name}", None)] for name in SECTIONS}
+        )
 
-        insert_bullet("did", "Done task", date=date)
-        insert_bullet("plan", "Planned task", date=date)
-        insert_bullet("block", "Blocker", date=date)
-        insert_bullet("meeting", "Meeting", date=date)
+        insert_bullet(section, "New bullet", date=date)
 
-        content = read_daily_file(date)
-        assert "- Done task" in content
-        assert "- Planned task" in content
-        assert "- Blocker" in content
-        assert "- Meeting" in content
+        for name in SECTIONS:
+            expected = [f"Existing {name}"]
+            if name == section:
+                expected.append("New bullet")
+            assert get_bullets_from_section(name, date) == expected
+
+    def test_insert_bullet_keeps_crlf_line_endings(self, temp_dailies_dir):
+        """Uses the file's existing CRLF line endings for the new bullet."""
+        date = datetime(2026, 1, 26)
+        file_path = get_daily_file_path(date)
+        file_path.write_bytes("## ✅ Done\r\n- Task 1\r\n\r\n".encode())
+
+        insert_bullet("did", "Task 2", date=date)
+
+        expected = "## ✅ Done\r\n- Task 1\r\n- Task 2\r\n\r\n".encode()
+        assert file_path.read_bytes() == expected
 
     def test_insert_bullet_invalid_section(self, temp_dailies_dir):
         """Raises error for invalid section."""
@@ -268,27 +308,26 @@ class TestGetBulletsFromSection:
     def test_get_bullets_from_section(self, temp_dailies_dir):
         """Gets all bullets from a section."""
         date = datetime(2026, 1, 26)
-        insert_bullet("did", "Task 1", date=date)
-        insert_bullet("did", "Task 2", date=date)
+        write_daily_with_bullets(date, {"did": [("Task 1", None), ("Task 2", None)]})
 
         bullets = get_bullets_from_section("did", date)
 
         assert "Task 1" in bullets
         assert "Task 2" in bullets
 
-    def test_get_bullets_from_empty_section(self, temp_dailies_dir):
+    def test_get_bullets_from_empty_section(self, in_memory_daily):
         """Returns empty list for section without bullets."""
-        date = datetime(2026, 1, 26)
-        ensure_daily_file_exists(date)
+        date = DATE
+        in_memory_daily[date] = TEMPLATE
 
         bullets = get_bullets_from_section("did", date)
 
         assert bullets == []
 
-    def test_get_bullets_invalid_section(self, temp_dailies_dir):
+    def test_get_bullets_invalid_section(self, in_memory_daily):
         """Raises error for invalid section."""
-        date = datetime(2026, 1, 26)
-        ensure_daily_file_exists(date)
+        date = DATE
+        in_memory_daily[date] = TEMPLATE
 
         with pytest.raises(ValueError, match="Invalid section"):
             get_bullets_from_section("invalid", date)
@@ -300,9 +339,16 @@ class TestGetFilteredBullets:
     def test_get_filtered_bullets(self, temp_dailies_dir):
         """Filters bullets by tags."""
         date = datetime(2026, 1, 26)
-        insert_bullet("did", "Task 1", tags=["cicd"], date=date)
-        insert_bullet("did", "Task 2", tags=["infra"], date=date)
-        insert_bullet("did", "Task 3", tags=["cicd", "aws"], date=date)
+        write_daily_with_bullets(
+            date,
+            {
+                "did": [
+                    ("Task 1", ["cicd"]),
+                    ("Task 2", ["infra"]),
+                    ("Task 3", ["cicd", "aws"]),
+                ]
+            },
+        )
 
         bullets = get_filtered_bullets("did", ["cicd"], date)
 
@@ -317,23 +363,31 @@ class TestGenerateCheat:
     def test_generate_cheat_basic(self, temp_dailies_dir):
         """Generates cheat sheet with all sections."""
         date = datetime(2026, 1, 26)
-        insert_bullet("did", "Deploy completed", date=date)
-        insert_bullet("plan", "Review PR", date=date)
-        insert_bullet("block", "Waiting for permissions", date=date)
+        get_daily_file_path(date).write_text(
+            "## ✅ Done\n- Deploy completed\n\n"
+            "## ▶️ To Do\n- Review PR\n\n"
+            "## 🚧 Blockers\n- Waiting for permissions\n",
+            encoding="utf-8",
+        )
 
         cheat = generate_cheat(date=date)
 
-        assert "DONE" in cheat
-        assert "TO DO" in cheat
-        assert "BLOCKERS" in cheat
-        assert "Deploy completed" in cheat
-        assert "Review PR" in cheat
-        assert "Waiting for permissions" in cheat
+        assert_contains_all(
+            cheat,
+            "DONE",
+            "TO DO",
+            "BLOCKERS",
+            "Deploy completed",
+            "Review PR",
+            "Waiting for permissions",
+        )
 
     def test_generate_cheat_no_markdown(self, temp_dailies_dir):
         """Output is plain text without Markdown."""
         date = datetime(2026, 1, 26)
-        insert_bullet("did", "Task", date=date)
+        get_daily_file_path(date).write_text(
+            TEMPLATE.replace("## ✅ Done\n", "## ✅ Done\n- Task\n"), encoding="utf-8"
+        )
 
         cheat = generate_cheat(date=date)
 
@@ -346,7 +400,9 @@ class TestGenerateCheat:
     def test_generate_cheat_shows_tags(self, temp_dailies_dir):
         """Shows tags in output."""
         date = datetime(2026, 1, 26)
-        insert_bullet("did", "Deploy", tags=["cicd", "aws"], date=date)
+        get_daily_file_path(date).write_text(
+            "## ✅ Done\n- Deploy #tags: cicd,aws\n", encoding="utf-8"
+        )
 
         cheat = generate_cheat(date=date)
 
@@ -357,9 +413,11 @@ class TestGenerateCheat:
     def test_generate_cheat_with_filter_tags(self, temp_dailies_dir):
         """Filters bullets by tags."""
         date = datetime(2026, 1, 26)
-        insert_bullet("did", "Task cicd", tags=["cicd"], date=date)
-        insert_bullet("did", "Task infra", tags=["infra"], date=date)
-        insert_bullet("plan", "Plan cicd", tags=["cicd"], date=date)
+        get_daily_file_path(date).write_text(
+            "## ✅ Done\n- Task cicd #tags: cicd\n- Task infra #tags: infra\n\n"
+            "## ▶️ To Do\n- Plan cicd #tags: cicd\n",
+            encoding="utf-8",
+        )
 
         cheat = generate_cheat(filter_tags=["cicd"], date=date)
 
@@ -369,8 +427,8 @@ class TestGenerateCheat:
 
     def test_generate_cheat_empty_sections(self, temp_dailies_dir):
         """Handles empty sections."""
-        date = datetime(2026, 1, 26)
-        ensure_daily_file_exists(date)
+        date = DATE
+        get_daily_file_path(date).write_text(TEMPLATE, encoding="utf-8")
 
         cheat = generate_cheat(date=date)
 
@@ -389,17 +447,23 @@ class TestGenerateCheat:
     def test_generate_cheat_includes_meetings(self, temp_dailies_dir):
         """Includes Done, Meetings, To Do, Blockers, and Quick Notes."""
         date = datetime(2026, 1, 26)
-        insert_bullet("did", "Task", date=date)
-        insert_bullet("meeting", "Important meeting", date=date)
-        insert_bullet("notes", "Quick note", date=date)
+        get_daily_file_path(date).write_text(
+            "## ✅ Done\n- Task\n\n"
+            "## 🗓 Meetings\n- Important meeting\n\n"
+            "## 🧠 Quick Notes\n- Quick note\n",
+            encoding="utf-8",
+        )
 
         cheat = generate_cheat(date=date)
 
-        assert "DONE" in cheat
-        assert "MEETINGS" in cheat
-        assert "TO DO" in cheat
-        assert "BLOCKERS" in cheat
-        assert "QUICK NOTES" in cheat
-        assert "Important meeting" in cheat
-        # Quick notes are now included in cheat
-        assert "Quick note" in cheat
+        assert_contains_all(
+            cheat,
+            "DONE",
+            "MEETINGS",
+            "TO DO",
+            "BLOCKERS",
+            "QUICK NOTES",
+            "Important meeting",
+            # Quick notes are now included in cheat
+            "Quick note",
+        )
@@ -2,7 +2,6 @@
 
 from datetime import datetime, timedelta
 
-import pytest
 from typer.testing import CliRunner
 
 from daily.cli import app
@@ -11,15 +10,6 @@ from daily.core import get_daily_file_path, read_daily_file, ensure_daily_file_e
 runner = CliRunner()
 
 
-@pytest.fixture
-def temp_dailies_dir(tmp_path, monkeypatch):
-    """Fixture that configures a temporary directory for dailies."""
-    dailies_dir = tmp_path / "dailies"
-    dailies_dir.mkdir()
-    monkeypatch.setenv("DAILY_DIR", str(dailies_dir))
-    return dailies_dir
-
-
 class TestEndToEndFlow:
     """End-to-end flow tests."""
 
@@ -4,15 +4,29 @@ from datetime import datetime
 
 import pytest
 
+from daily.config import SECTIONS
 from daily.markdown import (
+    _HEADER_RES,
+    _header_re,
     create_daily_template,
+    extract_all_sections,
     extract_bullets_from_section,
     filter_bullets_by_tags,
+    find_bullet_insertion,
+    find_next_section,
     find_section,
     format_bullet_with_tags,
     insert_at_section,
     parse_tags,
 )
+from tests.conftest import TEMPLATE
+
+# Shared input for the filter_bullets_by_tags cases (never mutated)
+_TAGGED_BULLETS = (
+    "Task 1 #tags: cicd",
+    "Task 2 #tags: infra",
+    "Task 3 #tags: cicd,aws",
+)
 
 
 class TestCreateDailyTemplate:
@@ -20,8 +34,7 @@ class TestCreateDailyTemplate:
 
     def test_create_daily_template_has_frontmatter(self):
         """Verifies template has YAML frontmatter."""
-        date = datetime(2026, 1, 26)
-        template = create_daily_template(date)
+        template = TEMPLATE
 
         assert template.startswith("---\n")
         assert "type: daily" in template
@@ -29,8 +42,7 @@ class TestCreateDailyTemplate:
 
     def test_create_daily_template_has_all_sections(self):
         """Verifies template has all sections."""
-        date = datetime(2026, 1, 26)
-        template = create_daily_template(date)
+        template = TEMPLATE
 
         assert "## ✅ Done" in template
         assert "## ▶️ To Do" in template
@@ -45,6 +57,16 @@ class TestCreateDailyTemplate:
 
         assert "date: 2026-12-31" in template
 
+    def test_create_daily_template_exact_content(self):
+        """Sections are separated by blank lines, in SECTIONS order."""
+        template = create_daily_template(datetime(2026, 1, 26))
+
+        assert template == (
+            "---\ntype: daily\ndate: 2026-01-26\n---\n\n"
+            "## ✅ Done\n\n## ▶️ To Do\n\n## 🚧 Blockers\n\n"
+            "## 🗓 Meetings\n\n## 🧠 Quick Notes\n"
+        )
+
 
 class TestFindSection:
     """Tests for find_section."""
@@ -73,6 +95,38 @@ class TestFindSection:
         result = find_section(content, "## ✅ Yesterday")
         assert result == 0
 
+    def test_find_section_ignores_partial_lines(self):
+        """Only a whole header line matches, even with CRLF line endings."""
+        content = "## ✅ Yesterday done\r\n\r\n## ✅ Yesterday\r\n"
+        result = find_section(content, "## ✅ Yesterday")
+        assert result == 2
+
+    def test_known_section_headers_are_precompiled(self):
+        """Header regexes of the SECTIONS titles are built once at import."""
+        for title in SECTIONS.values():
+            assert _header_re(title) is _HEADER_RES[title]
+
+
+class TestFindNextSection:
+    """Tests for find_next_section."""
+
+    def test_find_next_section(self):
+        """Finds the next known section header after the given line."""
+        content = "## ✅ Done\n- Task\n\n## ▶️ To Do\n## 🚧 Blockers\n"
+        assert find_next_section(content, 0) == 3
+        assert find_next_section(content, 3) == 4
+
+    def test_find_next_section_none_left(self):
+        """Returns the number of lines when no section follows."""
+        content = "## ✅ Done\n- Task\n"
+        assert find_next_section(content, 0) == 3
+        assert find_next_section(content, 5) == 3
+
+    def test_find_next_section_ignores_unknown_headers(self):
+        """Only SECTIONS titles end a section, even padded with whitespace."""
+        content = "## ✅ Done\n## Other\n  ## 🚧 Blockers \r\n"
+        assert find_next_section(content, 0) == 2
+
 
 class TestInsertAtSection:
     """Tests for insert_at_section."""
@@ -113,62 +167,97 @@ class TestInsertAtSection:
         assert "- Task 2" in result
 
 
-class TestParseTags:
-    """Tests for parse_tags."""
+class TestFindBulletInsertion:
+    """Tests for find_bullet_insertion."""
 
-    def test_parse_tags_single(self):
-        """Parses a single tag."""
-        bullet = "Completed task #tags: cicd"
-        result = parse_tags(bullet)
-        assert result == ["cicd"]
-
-    def test_parse_tags_multiple(self):
-        """Parses multiple tags."""
-        bullet = "Deploy project #tags: cicd,infra,aws"
-        result = parse_tags(bullet)
-        assert result == ["cicd", "infra", "aws"]
-
-    def test_parse_tags_with_spaces(self):
-        """Handles spaces in tags."""
-        bullet = "Task #tags: cicd, infra, aws"
-        result = parse_tags(bullet)
-        assert result == ["cicd", "infra", "aws"]
-
-    def test_parse_tags_no_tags(self):
-        """Returns empty list if no tags."""
-        bullet = "Task without tags"
-        result = parse_tags(bullet)
-        assert result == []
+    def test_insertion_after_last_bullet(self):
+        """Inserts a full line right after the section's last bullet."""
+        content = "## ✅ Done\n- Task 1\n\n## ▶️ To Do\n"
+        offset, text = find_bullet_insertion(content, "## ✅ Done", "Task 2")
 
-    def test_parse_tags_empty_tags(self):
-        """Handles empty tags."""
-        bullet = "Task #tags: "
-        result = parse_tags(bullet)
-        assert result == []
+        assert content[:offset] == "## ✅ Done\n- Task 1\n"
+        assert text == "- Task 2\n"
 
+    def test_insertion_at_end_without_trailing_newline(self):
+        """Prepends the newline when the section ends the file."""
+        content = "## ✅ Done\n- Task 1"
+        offset, text = find_bullet_insertion(content, "## ✅ Done", "Task 2")
 
-class TestFormatBulletWithTags:
-    """Tests for format_bullet_with_tags."""
+        assert offset == len(content)
+        assert text == "\n- Task 2"
 
-    def test_format_with_tags(self):
-        """Formats text with tags."""
-        result = format_bullet_with_tags("Task", ["cicd", "infra"])
-        assert result == "Task #tags: cicd,infra"
+    def test_insertion_uses_given_newline(self):
+        """Uses the given line ending for the inserted line."""
+        content = "## ✅ Done\r\n- Task 1\r\n\r\n## ▶️ To Do\r\n"
+        offset, text = find_bullet_insertion(
+            content, "## ✅ Done", "Task 2", newline="\r\n"
+        )
 
-    def test_format_without_tags(self):
-        """Returns text unchanged if no tags."""
-        result = format_bullet_with_tags("Task", None)
-        assert result == "Task"
+        assert content[:offset] == "## ✅ Done\r\n- Task 1\r\n"
+        assert text == "- Task 2\r\n"
 
-    def test_format_empty_tags(self):
-        """Returns text unchanged if tag list is empty."""
-        result = format_bullet_with_tags("Task", [])
-        assert result == "Task"
+    def test_insertion_section_not_found(self):
+        """Raises error if section doesn't exist."""
+        with pytest.raises(ValueError, match="not found"):
+            find_bullet_insertion("## ✅ Done\n", "## Does not exist", "Task")
+
+    def test_insertion_uses_first_occurrence(self):
+        """Inserts into the first of two headers with the same title."""
+        content = "## ✅ Done\n- Task 1\n\n## ▶️ To Do\n\n## ✅ Done\n- Old\n"
+        offset, text = find_bullet_insertion(content, "## ✅ Done", "Task 2")
+        assert content[:offset] == "## ✅ Done\n- Task 1\n"
+
+    def test_insertion_in_unknown_section(self):
+        """A header that isn't a known section ends at the next known one."""
+        content = "## Custom\n- A\n## Other\n- B\n## ▶️ To Do\n"
+        offset, text = find_bullet_insertion(content, "## Custom", "C")
+        assert content[:offset] == "## Custom\n- A\n## Other\n- B\n"
 
-    def test_format_single_tag(self):
-        """Formats with a single tag."""
-        result = format_bullet_with_tags("Task", ["cicd"])
-        assert result == "Task #tags: cicd"
+
+class TestParseTags:
+    """Tests for parse_tags."""
+
+    @pytest.mark.parametrize(
+        "bullet,expected",
+        [
+            pytest.param("Completed task #tags: cicd", ["cicd"], id="single"),
+            pytest.param(
+                "Deploy project #tags: cicd,infra,aws",
+                ["cicd", "infra", "aws"],
+                id="multiple",
+            ),
+            pytest.param(
+                "Task #tags: cicd, infra, aws",
+                ["cicd", "infra", "aws"],
+                id="with_spaces",
+            ),
+            pytest.param("Task without tags", [], id="no_tags"),
+            pytest.param(
+                "Task #tags:cicd,infra", ["cicd", "infra"], id="without_space"
+            ),
+            pytest.param("Task #tags: ", [], id="empty_tags"),
+        ],
+    )
+    def test_parse_tags(self, bullet, expected):
+        """Extracts the tag list after the marker, if any."""
+        assert parse_tags(bullet) == expected
+
+
+class TestFormatBulletWithTags:
+    """Tests for format_bullet_with_tags."""
+
+    @pytest.mark.parametrize(
+        "tags,expected",
+        [
+            pytest.param(["cicd", "infra"], "Task #tags: cicd,infra", id="with_tags"),
+            pytest.param(None, "Task", id="without_tags"),
+            pytest.param([], "Task", id="empty_tags"),
+            pytest.param(["cicd"], "Task #tags: cicd", id="single_tag"),
+        ],
+    )
+    def test_format_bullet_with_tags(self, tags, expected):
+        """Appends the tags marker only when there are tags."""
+        assert format_bullet_with_tags("Task", tags) == expected
 
 
 class TestExtractBulletsFromSection:
@@ -199,33 +288,89 @@ class TestExtractBulletsFromSection:
         assert result == ["Task #tags: cicd"]
 
 
+class TestExtractAllSections:
+    """Tests for extract_all_sections."""
+
+    def test_extract_all_sections_basic(self):
+        """Extracts bullets from every requested section."""
+        content = "## ✅ Done\n- Task 1\n- Task 2\n\n## ▶️ To Do\n- Plan\n"
+        result = extract_all_sections(content, ["## ✅ Done", "## ▶️ To Do"])
+        assert result == {"## ✅ Done": ["Task 1", "Task 2"], "## ▶️ To Do": ["Plan"]}
+
+    def test_extract_all_sections_missing_section(self):
+        """Missing sections map to an empty list."""
+        content = "## ✅ Done\n- Task\n"
+        result = extract_all_sections(content, ["## ✅ Done", "## 🚧 Blockers"])
+        assert result == {"## ✅ Done": ["Task"], "## 🚧 Blockers": []}
+
+    def test_extract_all_sections_matches_single_section(self):
+        """Gives the same bullets as extract_bullets_from_section."""
+        content = TEMPLATE
+        content = insert_at_section(content, "## ✅ Done", "Task #tags: cicd")
+        content = insert_at_section(content, "## 🧠 Quick Notes", "Note")
+        titles = ["## ✅ Done", "## ▶️ To Do", "## 🧠 Quick Notes"]
+
+        result = extract_all_sections(content, titles)
+
+        for title in titles:
+            assert result[title] == extract_bullets_from_section(content, title)
+
+    def test_extract_all_sections_strips_like_single_section(self):
+        """Inner spaces are kept and Unicode whitespace is stripped."""
+        content = TEMPLATE
+        content = insert_at_section(content, "## ▶️ To Do", "  spaced text")
+        content = content.replace("## ▶️ To Do\n", "## ▶️ To Do\n\u3000- Wide indent\n")
+
+        result = extract_all_sections(content, ["## ▶️ To Do"])
+
+        assert result["## ▶️ To Do"] == ["Wide indent", "  spaced text"]
+        assert result["## ▶️ To Do"] == extract_bullets_from_section(
+            content, "## ▶️ To Do"
+        )
+
+    def test_extract_all_sections_filters_by_tags(self):
+        """Keeps only bullets with one of the tags, like filter_bullets_by_tags."""
+        content = TEMPLATE
+        for bullet in ["A #tags: cicd", "B", "C #tags: aws,CICD", "D #tags: infra"]:
+            content = insert_at_section(content, "## ✅ Done", bullet)
+        titles = ["## ✅ Done", "## ▶️ To Do"]
+
+        result = extract_all_sections(content, titles, ["cicd"])
+
+        assert result == {
+            title: filter_bullets_by_tags(bullets, ["cicd"])
+            for title, bullets in extract_all_sections(content, titles).items()
+        }
+        assert result["## ✅ Done"] == ["A #tags: cicd", "C #tags: aws,CICD"]
+
+    def test_extract_all_sections_crlf_line_endings(self):
+        """Handles content with Windows line endings."""
+        content = "## ✅ Done\r\n- Task 1\r\n\r\n## ▶️ To Do\r\n- Plan\r\n"
+        result = extract_all_sections(content, ["## ✅ Done", "## ▶️ To Do"])
+        assert result == {"## ✅ Done": ["Task 1"], "## ▶️ To Do": ["Plan"]}
+
+
 class TestFilterBulletsByTags:
     """Tests for filter_bullets_by_tags."""
 
-    def test_filter_by_single_tag(self):
-        """Filters by a single tag."""
-        bullets = [
-            "Task 1 #tags: cicd",
-            "Task 2 #tags: infra",
-            "Task 3 #tags: cicd,aws",
-        ]
+    @pytest.mark.parametrize(
+        "tags,expected_indices",
+        [
+            pytest.param(["cicd"], [0, 2], id="single_tag"),
+            # Several tags match any of them (OR)
+            pytest.param(["infra", "aws"], [1, 2], id="multiple_tags"),
+            pytest.param(["none"], [], id="no_match"),
+        ],
+    )
+    def test_filter_by_tags(self, tags, expected_indices):
+        """Keeps the bullets having at least one of the tags, in order."""
+        result = filter_bullets_by_tags(_TAGGED_BULLETS, tags)
+        assert result == [_TAGGED_BULLETS[i] for i in expected_indices]
+
+    def test_filter_untagged_bullets(self):
+        """Returns empty list when no bullet has tags."""
+        bullets = ["Task 1", "Task 2 mentions cicd"]
         result = filter_bullets_by_tags(bullets, ["cicd"])
-        assert result == ["Task 1 #tags: cicd", "Task 3 #tags: cicd,aws"]
-
-    def test_filter_by_multiple_tags(self):
-        """Filters by multiple tags (OR)."""
-        bullets = [
-            "Task 1 #tags: cicd",
-            "Task 2 #tags: infra",
-            "Task 3 #tags: aws",
-        ]
-        result = filter_bullets_by_tags(bullets, ["cicd", "aws"])
-        assert result == ["Task 1 #tags: cicd", "Task 3 #tags: aws"]
-
-    def test_filter_no_match(self):
-        """Returns empty list if no matches."""
-        bullets = ["Task 1 #tags: cicd"]
-        result = filter_bullets_by_tags(bullets, ["infra"])
         assert result == []
 
     def test_filter_empty_tags(self):
@@ -239,3 +384,25 @@ class TestFilterBulletsByTags:
         bullets = ["Task #tags: CICD"]
         result = filter_bullets_by_tags(bullets, ["cicd"])
         assert result == ["Task #tags: CICD"]
+
+    def test_filter_large_list(self):
+        """Long lists give exact, case-insensitive matches."""
+        bullets = [f"Task {i} #tags: awscli" for i in range(40)]
+        bullets += ["Deploy #tags: infra, AWS", "Mentions aws only", "Ship #tags: aws"]
+
+        result = filter_bullets_by_tags(bullets, ["aws"])
+
+        assert result == ["Deploy #tags: infra, AWS", "Ship #tags: aws"]
+
+    @pytest.mark.parametrize("tag", ["aws", "σ", "İ"])
+    def test_filter_large_list_matches_small_lists(self, tag):
+        """A long list keeps the same bullets as filtering them one by one."""
+        tails = ["aws", "AWS, infra", "awscli", "Σ", "x,ς", "İ", "i"]
+        bullets = [f"Task {i} #tags:{tails[i % len(tails)]}" for i in range(40)]
+        bullets += ["Untagged mentions aws Σ İ"]
+
+        result = filter_bullets_by_tags(bullets, [tag])
+
+        assert len(bullets) > 32
+        assert result
+        assert result == [b for b in bullets if filter_bullets_by_tags([b], [tag])]
@@ -1,8 +1,7 @@
 """Tests for search functionality."""
 
-import tempfile
-from datetime import datetime, timedelta
-from pathlib import Path
+import json
+from datetime import datetime
 
 import pytest
 
@@ -10,22 +9,10 @@ from daily.core import (
     format_daily_file_for_display,
     insert_bullet,
     list_daily_files,
+    list_daily_files_with_tags,
 )
 from daily.markdown import create_daily_template
-
-
-@pytest.fixture
-def temp_dailies_dir(monkeypatch):
-    """Create temporary dailies directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        dailies_path = Path(tmpdir) / "dailies"
-        dailies_path.mkdir()
-
-        # Patch get_dailies_dir to return our temp directory
-        monkeypatch.setattr("daily.core.get_dailies_dir", lambda: dailies_path)
-        monkeypatch.setattr("daily.config.get_dailies_dir", lambda: dailies_path)
-
-        yield dailies_path
+from tests.conftest import assert_contains_all, write_daily_with_bullets
 
 
 def test_list_daily_files_empty(temp_dailies_dir):
@@ -37,7 +24,8 @@ def test_list_daily_files_empty(temp_dailies_dir):
 def test_list_daily_files_single(temp_dailies_dir):
     """Test listing with a single file."""
     date = datetime(2026, 1, 27)
-    insert_bullet("did", "Test entry", date=date)
+    # Listing only looks at file names, so a stub file is enough
+    (temp_dailies_dir / "2026-01-27-daily.md").write_text("---\ntype: daily\n---\n")
 
     result = list_daily_files()
     assert len(result) == 1
@@ -50,9 +38,9 @@ def test_list_daily_files_multiple_sorted(temp_dailies_dir):
     date2 = datetime(2026, 1, 27)
     date3 = datetime(2026, 1, 26)
 
-    insert_bullet("did", "Entry 1", date=date1)
-    insert_bullet("did", "Entry 2", date=date2)
-    insert_bullet("did", "Entry 3", date=date3)
+    for date in (date1, date2, date3):
+        file_path = temp_dailies_dir / date.strftime("%Y-%m-%d-daily.md")
+        file_path.write_text("---\ntype: daily\n---\n")
 
     result = list_daily_files()
     assert len(result) == 3
@@ -62,6 +50,20 @@ def test_list_daily_files_multiple_sorted(temp_dailies_dir):
     assert result[2][1] == date1
 
 
+def test_list_daily_files_ignores_other_files(temp_dailies_dir):
+    """Test that files not named YYYY-MM-DD-daily.md are skipped."""
+    date = datetime(2026, 1, 27)
+    insert_bullet("did", "Test entry", date=date)
+    (temp_dailies_dir / "notes.md").write_text("not a daily")
+    (temp_dailies_dir / "draft-daily.md").write_text("bad date")
+    (temp_dailies_dir / "2026-13-01-daily.md").write_text("bad month")
+    (temp_dailies_dir / "2026_01_28-daily.md").write_text("bad separators")
+    (temp_dailies_dir / "+026-01-28-daily.md").write_text("bad year")
+
+    result = list_daily_files()
+    assert [file_date for _, file_date in result] == [date]
+
+
 def test_list_daily_files_with_tag_filter(temp_dailies_dir):
     """Test filtering files by tags."""
     date1 = datetime(2026, 1, 25)
@@ -87,6 +89,15 @@ def test_list_daily_files_with_tag_filter(temp_dailies_dir):
     assert len(result) == 2
 
 
+def test_list_daily_files_tag_only_in_text(temp_dailies_dir):
+    """Test that a tag mentioned in bullet text but not tagged doesn't match."""
+    date = datetime(2026, 1, 27)
+    insert_bullet("did", "Talked about projectA", tags=["meeting"], date=date)
+
+    result = list_daily_files(filter_tags=["projectA"])
+    assert result == []
+
+
 def test_list_daily_files_tag_case_insensitive(temp_dailies_dir):
     """Test that tag filtering is case insensitive."""
     date = datetime(2026, 1, 27)
@@ -96,16 +107,23 @@ def test_list_daily_files_tag_case_insensitive(temp_dailies_dir):
     assert len(result) == 1
 
 
+def test_list_daily_files_non_ascii_tag_case_insensitive(temp_dailies_dir):
+    """Test that non-ASCII tags are also matched case insensitively."""
+    date = datetime(2026, 1, 27)
+    insert_bullet("did", "Test entry", tags=["Été"], date=date)
+
+    result = list_daily_files(filter_tags=["été"])
+    assert len(result) == 1
+
+
 def test_format_daily_file_for_display(temp_dailies_dir):
     """Test formatting file for display."""
     date = datetime(2026, 1, 27)  # Tuesday
-    insert_bullet("did", "Entry 1", date=date)
-    insert_bullet("plan", "Entry 2", date=date)
+    file_path = write_daily_with_bullets(
+        date, {"did": [("Entry 1", None)], "plan": [("Entry 2", None)]}
+    )
 
-    result = list_daily_files()
-    file_path, file_date = result[0]
-
-    display = format_daily_file_for_display(file_path, file_date)
+    display = format_daily_file_for_display(file_path, date)
 
     # Should contain date and day name (no tags in this case)
     assert "2026-01-27" in display
@@ -117,12 +135,9 @@ def test_format_daily_file_for_display(temp_dailies_dir):
 def test_format_daily_file_for_display_single_entry(temp_dailies_dir):
     """Test formatting with single entry (no entry count shown)."""
     date = datetime(2026, 1, 27)
-    insert_bullet("did", "Single entry", date=date)
+    file_path = insert_bullet("did", "Single entry", date=date)
 
-    result = list_daily_files()
-    file_path, file_date = result[0]
-
-    display = format_daily_file_for_display(file_path, file_date)
+    display = format_daily_file_for_display(file_path, date)
 
     assert "2026-01-27" in display
     assert "Tuesday" in display
@@ -147,19 +162,123 @@ def test_format_daily_file_for_display_no_entries(temp_dailies_dir):
 def test_format_daily_file_for_display_with_tags(temp_dailies_dir):
     """Test formatting includes tags when present."""
     date = datetime(2026, 1, 27)
-    insert_bullet("did", "Deploy project", tags=["aws", "deploy"], date=date)
-    insert_bullet("plan", "Review code", tags=["review"], date=date)
+    write_daily_with_bullets(
+        date,
+        {
+            "did": [("Deploy project", ["aws", "deploy"])],
+            "plan": [("Review code", ["review"])],
+        },
+    )
 
-    result = list_daily_files()
-    file_path, file_date = result[0]
+    result = list_daily_files_with_tags(filter_tags=["aws", "review"])
+    file_path, file_date, tags = result[0]
 
-    display = format_daily_file_for_display(file_path, file_date)
+    display = format_daily_file_for_display(file_path, file_date, tags)
 
     # Should contain date, day name, and tags (no entry count)
-    assert "2026-01-27" in display
-    assert "Tuesday" in display
     assert "entries" not in display  # No entry count
-    assert "tags:" in display
-    assert "aws" in display
-    assert "deploy" in display
-    assert "review" in display
+    assert_contains_all(
+        display, "2026-01-27", "Tuesday", "tags:", "aws", "deploy", "review"
+    )
+
+
+def test_list_daily_files_with_tags_unfiltered_has_no_tags(temp_dailies_dir):
+    """Test that tags are only collected when filtering."""
+    insert_bullet("did", "Deploy", tags=["aws"], date=datetime(2026, 1, 27))
+
+    result = list_daily_files_with_tags()
+
+    assert result[0][2] is None
+
+
+def test_format_daily_file_for_display_does_not_read_file(tmp_path):
+    """Test that display formatting doesn't touch the file."""
+    missing = tmp_path / "2026-01-27-daily.md"
+
+    display = format_daily_file_for_display(missing, datetime(2026, 1, 27))
+
+    assert display == "2026-01-27 (Tuesday)"
+
+
+def test_list_daily_files_writes_tag_index(temp_dailies_dir, isolated_index_file):
+    """Test that tag filtering records each file's tags in the index."""
+    insert_bullet("did", "Deploy", tags=["aws"], date=datetime(2026, 1, 27))
+
+    list_daily_files(filter_tags=["aws"])
+
+    index = json.loads(isolated_index_file.read_text(encoding="utf-8"))
+    entry = index[str(temp_dailies_dir)]["2026-01-27-daily.md"]
+    assert entry[2] == ["aws"]
+
+
+def test_list_daily_files_uses_tag_index(temp_dailies_dir, isolated_index_file):
+    """Test that unchanged files are served from the index without parsing."""
+    file_path = insert_bullet("did", "Deploy", tags=["aws"], date=datetime(2026, 1, 27))
+    list_daily_files(filter_tags=["aws"])
+
+    # Tamper with the cached tags; the file itself is unchanged
+    index = json.loads(isolated_index_file.read_text(encoding="utf-8"))
+    index[str(temp_dailies_dir)][file_path.name][2] = ["cached"]
+    isolated_index_file.write_text(json.dumps(index), encoding="utf-8")
+
+    assert list_daily_files(filter_tags=["cached"]) == [
+        (file_path, datetime(2026, 1, 27))
+    ]
+
+
+def test_list_daily_files_reparses_modified_files(temp_dailies_dir):
+    """Test that a file changed since it was indexed is parsed again."""
+    date = datetime(2026, 1, 27)
+    insert_bullet("did", "Deploy", tags=["aws"], date=date)
+    assert list_daily_files(filter_tags=["infra"]) == []
+
+    insert_bullet("did", "Terraform", tags=["infra"], date=date)
+
+    assert len(list_daily_files(filter_tags=["infra"])) == 1
+
+
+def test_list_daily_files_ignores_corrupt_index(temp_dailies_dir, isolated_index_file):
+    """Test that an unreadable index is rebuilt instead of failing."""
+    insert_bullet("did", "Deploy", tags=["aws"], date=datetime(2026, 1, 27))
+    isolated_index_file.parent.mkdir(parents=True, exist_ok=True)
+    isolated_index_file.write_text("{not json", encoding="utf-8")
+
+    assert len(list_daily_files(filter_tags=["aws"])) == 1
+    assert json.loads(isolated_index_file.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize(
+    "entries",
+    [
+        pytest.param({"2026-01-27-daily.md": 5}, id="entry_not_a_list"),
+        pytest.param({"2026-01-27-daily.md": [1, 2]}, id="entry_too_short"),
+        pytest.param({"2026-01-27-daily.md": [1, 2, [3]]}, id="tag_not_a_str"),
+        pytest.param([], id="directory_not_a_dict"),
+    ],
+)
+def test_list_daily_files_ignores_malformed_index(
+    temp_dailies_dir, isolated_index_file, entries
+):
+    """Test that valid JSON with the wrong shape is rebuilt instead of failing."""
+    insert_bullet("did", "Deploy", tags=["aws"], date=datetime(2026, 1, 27))
+    isolated_index_file.parent.mkdir(parents=True, exist_ok=True)
+    isolated_index_file.write_text(
+        json.dumps({str(temp_dailies_dir): entries}), encoding="utf-8"
+    )
+
+    assert len(list_daily_files(filter_tags=["aws"])) == 1
+    index = json.loads(isolated_index_file.read_text(encoding="utf-8"))
+    assert index[str(temp_dailies_dir)]["2026-01-27-daily.md"][2] == ["aws"]
+
+
+def test_importing_core_does_not_load_json():
+    """Test that json is only imported when the tag index is used."""
+    import subprocess
+    import sys
+
+    code = "import sys, daily.core; print('json' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"